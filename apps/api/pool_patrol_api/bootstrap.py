@@ -0,0 +1,40 @@
+"""Process setup that must run before the app's modules are imported.
+
+Imported for its side effect by main.py, ahead of the routers and services.
+"""
+
+import sys
+from pathlib import Path
+
+# Project root is 4 levels up from this file
+_project_root = Path(__file__).parent.parent.parent.parent
+
+
+def _bootstrap() -> None:
+    """Prepare the process environment once, before importing app modules.
+
+    Guarded on `sys` so re-imports of this module (reloaders, tests, app
+    factories) don't reload .env or purge our own already-imported `tools`.
+    """
+    if getattr(sys, "_poolpatrol_bootstrapped", False):
+        return
+
+    # Load environment variables from project root .env file
+    from dotenv import load_dotenv
+    load_dotenv(_project_root / ".env", override=True)
+
+    # Add packages directory to Python path (must be before other imports)
+    # This ensures pool_patrol's packages are found before any conflicting packages
+    packages_dir = str(_project_root / "packages")
+    if packages_dir not in sys.path:
+        sys.path.insert(0, packages_dir)
+
+    # Remove any cached 'tools' module that might be from a different project
+    # This is needed because another project's 'tools' package may have been imported
+    for mod_name in [m for m in sys.modules if m == "tools" or m.startswith("tools.")]:
+        sys.modules.pop(mod_name, None)
+
+    sys._poolpatrol_bootstrapped = True
+
+
+_bootstrap()
@@ -1,10 +1,47 @@
 """Dependency injection for Pool Patrol API."""
 
+from collections.abc import AsyncGenerator
 from typing import Annotated
 
-from fastapi import Depends
+import httpx
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.database import get_async_session
+from pool_patrol_api.services.data_service import DataService
+
+
+def get_data_service(request: Request) -> DataService:
+    """Get the app-scoped DataService built at startup.
+
+    Returns:
+        Singleton DataService instance stored on app.state
+    """
+    return request.app.state.data_service
 
-from pool_patrol_api.services.data_service import DataService, get_data_service
 
 # Type alias for injecting DataService
 DataServiceDep = Annotated[DataService, Depends(get_data_service)]
+
+
+async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """Yield a pooled async session for the duration of a request.
+
+    FastAPI caches the dependency per request, so every consumer within one
+    request shares the same session and connection.
+    """
+    async with get_async_session() as session:
+        yield session
+
+
+# Type alias for injecting an AsyncSession
+DbSessionDep = Annotated[AsyncSession, Depends(get_db_session)]
+
+
+def get_resend_client(request: Request) -> httpx.AsyncClient:
+    """Get the app-scoped Resend HTTP client created at startup."""
+    return request.app.state.resend_client
+
+
+# Type alias for injecting the Resend client
+ResendClientDep = Annotated[httpx.AsyncClient, Depends(get_resend_client)]
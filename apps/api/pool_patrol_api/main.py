@@ -1,36 +1,34 @@
 """FastAPI application entry point."""
 
-import sys
-from pathlib import Path
-
-# Project root is 4 levels up from this file
-_project_root = Path(__file__).parent.parent.parent.parent
-
-# Load environment variables from project root .env file
-from dotenv import load_dotenv
-load_dotenv(_project_root / ".env", override=True)
-
-# Add packages directory to Python path (must be before other imports)
-# This ensures pool_patrol's packages are found before any conflicting packages
-_packages_dir = _project_root / "packages"
-if str(_packages_dir) not in sys.path:
-    sys.path.insert(0, str(_packages_dir))
-
-# Remove any cached 'tools' module that might be from a different project
-# This is needed because another project's 'tools' package may have been imported
-for _mod_name in list(sys.modules.keys()):
-    if _mod_name == "tools" or _mod_name.startswith("tools."):
-        del sys.modules[_mod_name]
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+# Loads .env and sets up sys.path; must stay above the other app imports
+import pool_patrol_api.bootstrap  # noqa: F401
 from pool_patrol_api.routers import cases, emails, employees, vanpools
+from pool_patrol_api.services.data_service import DataService
+from pool_patrol_api.services.resend_client import create_resend_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build app-scoped services once per worker instead of per request."""
+    app.state.data_service = DataService()
+    app.state.resend_client = create_resend_client()
+    yield
+    await app.state.resend_client.aclose()
+
 
 app = FastAPI(
     title="Pool Patrol API",
     description="Multi-agent vanpool misuse detection system",
     version="0.1.0",
+    lifespan=lifespan,
+    # orjson renders response bodies several times faster than stdlib json
+    default_response_class=ORJSONResponse,
 )
 
 # Mount routers
@@ -59,3 +57,19 @@ async def health_check() -> dict[str, str]:
 async def root() -> dict[str, str]:
     """Root endpoint."""
     return {"message": "Pool Patrol API", "docs": "/docs"}
+
+
+if __name__ == "__main__":
+    import os
+
+    import uvicorn
+
+    # uvloop/httptools ship with uvicorn[standard] and cut per-request dispatch overhead
+    uvicorn.run(
+        "pool_patrol_api.main:app",
+        host=os.environ.get("HOST", "127.0.0.1"),
+        port=int(os.environ.get("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY", "1")),
+    )
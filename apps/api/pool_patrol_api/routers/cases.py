@@ -1,17 +1,21 @@
 """Case API routes."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Query, Response
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import select, update
 
-from pool_patrol_api.dependencies import DataServiceDep
-from core.database import get_session
+from pool_patrol_api.dependencies import DataServiceDep, DbSessionDep
+from pool_patrol_api.services.response_cache import cached_json_response, invalidate
 from core.db_models import Case as DbCase, CaseStatus as DbCaseStatus, Vanpool as DbVanpool, VanpoolStatus as DbVanpoolStatus
 from core.models import Case, CaseStatus, EmailThread
+from tools.case_cache import invalidate_case_cache
 
 router = APIRouter(prefix="/api/cases", tags=["cases"])
 
+_CASE_LIST_ADAPTER = TypeAdapter(tuple[Case, ...])
+
 
 # =============================================================================
 # Request/Response Models
@@ -30,13 +34,17 @@ async def list_cases(
     data_service: DataServiceDep,
     status: CaseStatus | None = Query(None, description="Filter by case status"),
     vanpool_id: str | None = Query(None, description="Filter by vanpool ID"),
-) -> list[Case]:
+) -> Response:
     """List all cases with optional filtering.
 
     - **status**: Filter by case status (open, verification, pending_reply, re_audit, hitl_review, pre_cancel, resolved, cancelled)
     - **vanpool_id**: Filter by vanpool ID
     """
-    return data_service.get_cases(status=status, vanpool_id=vanpool_id)
+    return cached_json_response(
+        ("cases", status, vanpool_id),
+        _CASE_LIST_ADAPTER,
+        lambda: data_service.get_cases(status=status, vanpool_id=vanpool_id),
+    )
 
 
 @router.get("/{case_id}", response_model=Case)
@@ -55,14 +63,12 @@ async def get_case(
 async def get_case_emails(
     case_id: str,
     data_service: DataServiceDep,
-) -> list[EmailThread]:
+) -> tuple[EmailThread, ...]:
     """Get all email threads associated with a case.
 
     Use this endpoint when viewing case details to fetch related communications.
     """
-    # First verify the case exists
-    case = data_service.get_case(case_id)
-    if case is None:
+    if not data_service.has_case(case_id):
         raise HTTPException(status_code=404, detail=f"Case {case_id} not found")
 
     return data_service.get_case_emails(case_id)
@@ -71,6 +77,7 @@ async def get_case_emails(
 @router.post("/{case_id}/cancel-vanpool", response_model=CancelVanpoolResponse)
 async def cancel_vanpool(
     case_id: str,
+    session: DbSessionDep,
 ) -> CancelVanpoolResponse:
     """Cancel an entire vanpool service.
 
@@ -83,47 +90,49 @@ async def cancel_vanpool(
     Returns:
         Cancellation result
     """
-    with get_session() as session:
-        # Get the case
-        case = (
-            session.query(DbCase)
-            .filter(DbCase.case_id == case_id)
-            .first()
+    # Cancel the case directly; the status guard lives in the WHERE clause
+    vanpool_id = (
+        await session.execute(
+            update(DbCase)
+            .where(DbCase.case_id == case_id, DbCase.status == DbCaseStatus.PRE_CANCEL)
+            .values(
+                status=DbCaseStatus.CANCELLED,
+                outcome="Vanpool " + DbCase.vanpool_id
+                + " service cancelled due to unresolved eligibility issues",
+                resolved_at=datetime.now(UTC),
+            )
+            .returning(DbCase.vanpool_id)
         )
-
-        if case is None:
+    ).scalar_one_or_none()
+
+    if vanpool_id is None:
+        # Nothing updated - work out whether the case is missing or in the wrong state
+        current_status = (
+            await session.execute(select(DbCase.status).where(DbCase.case_id == case_id))
+        ).scalar_one_or_none()
+        if current_status is None:
             raise HTTPException(status_code=404, detail=f"Case {case_id} not found")
-
-        if case.status != DbCaseStatus.PRE_CANCEL:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Case {case_id} is not in pre_cancel status (current: {case.status})"
-            )
-
-        vanpool_id = case.vanpool_id
-
-        # Get the vanpool
-        vanpool = (
-            session.query(DbVanpool)
-            .filter(DbVanpool.vanpool_id == vanpool_id)
-            .first()
+        raise HTTPException(
+            status_code=400,
+            detail=f"Case {case_id} is not in pre_cancel status (current: {current_status})"
         )
 
-        if vanpool is None:
-            raise HTTPException(status_code=404, detail=f"Vanpool {vanpool_id} not found")
-
-        # Update vanpool status to suspended
-        vanpool.status = DbVanpoolStatus.SUSPENDED
-
-        # Update case status to cancelled
-        case.status = DbCaseStatus.CANCELLED
-        case.outcome = f"Vanpool {vanpool_id} service cancelled due to unresolved eligibility issues"
-        case.resolved_at = datetime.utcnow()
-
-        session.commit()
-
-        return CancelVanpoolResponse(
-            cancelled=True,
-            vanpool_id=vanpool_id,
-            case_id=case_id,
-        )
+    # Suspend the vanpool (raising rolls back the case update above)
+    result = await session.execute(
+        update(DbVanpool)
+        .where(DbVanpool.vanpool_id == vanpool_id)
+        .values(status=DbVanpoolStatus.SUSPENDED)
+    )
+    if result.rowcount == 0:
+        raise HTTPException(status_code=404, detail=f"Vanpool {vanpool_id} not found")
+
+    await session.commit()
+
+    invalidate("cases", "vanpools")
+    invalidate_case_cache()
+
+    return CancelVanpoolResponse(
+        cancelled=True,
+        vanpool_id=vanpool_id,
+        case_id=case_id,
+    )
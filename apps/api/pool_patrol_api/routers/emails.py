@@ -1,23 +1,29 @@
 """Email thread API routes."""
 
-import os
 from datetime import datetime
 
-import resend
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
-
-from pool_patrol_api.dependencies import DataServiceDep
-from core.database import get_session
-from core.db_models import Case as DbCase, CaseStatus, Message as DbMessage, MessageStatusEnum
+from fastapi import APIRouter, HTTPException, Query, Response
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+
+from pool_patrol_api.dependencies import DataServiceDep, DbSessionDep, ResendClientDep
+from pool_patrol_api.services.response_cache import cached_json_response, invalidate
+from core.db_models import (
+    CaseStatus,
+    EmailThread as DbEmailThread,
+    Message as DbMessage,
+    MessageStatusEnum,
+)
 from core.models import EmailThread, Message, ThreadStatus
+from tools.case_cache import invalidate_case_cache
 
 router = APIRouter(prefix="/api/emails", tags=["emails"])
 
-# Configure Resend API
-resend.api_key = os.environ.get("RESEND_API_KEY", "")
 FROM_EMAIL = "Pool Patrol <contact@send.joyax.co>"
 
+_THREAD_LIST_ADAPTER = TypeAdapter(tuple[EmailThread, ...])
+
 
 # =============================================================================
 # Request/Response Models
@@ -48,13 +54,17 @@ async def list_email_threads(
     data_service: DataServiceDep,
     status: ThreadStatus | None = Query(None, description="Filter by thread status"),
     vanpool_id: str | None = Query(None, description="Filter by vanpool ID"),
-) -> list[EmailThread]:
+) -> Response:
     """List all email threads with optional filtering.
 
     - **status**: Filter by thread status (active, closed, archived)
     - **vanpool_id**: Filter by vanpool ID
     """
-    return data_service.get_email_threads(status=status, vanpool_id=vanpool_id)
+    return cached_json_response(
+        ("email_threads", status, vanpool_id),
+        _THREAD_LIST_ADAPTER,
+        lambda: data_service.get_email_threads(status=status, vanpool_id=vanpool_id),
+    )
 
 
 @router.get("/threads/{thread_id}", response_model=EmailThread)
@@ -94,6 +104,7 @@ async def get_thread_messages(
 async def update_draft_message(
     message_id: str,
     request: UpdateDraftRequest,
+    session: DbSessionDep,
 ) -> UpdateDraftResponse:
     """Update a draft message's body.
 
@@ -106,35 +117,36 @@ async def update_draft_message(
     Returns:
         Updated message details
     """
-    with get_session() as session:
-        message = (
-            session.query(DbMessage)
-            .filter(DbMessage.message_id == message_id)
-            .first()
-        )
+    message = (
+        await session.execute(select(DbMessage).where(DbMessage.message_id == message_id))
+    ).scalar_one_or_none()
 
-        if message is None:
-            raise HTTPException(status_code=404, detail=f"Message {message_id} not found")
+    if message is None:
+        raise HTTPException(status_code=404, detail=f"Message {message_id} not found")
 
-        if message.status != MessageStatusEnum.DRAFT:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Message {message_id} is not a draft (status: {message.status})"
-            )
+    if message.status != MessageStatusEnum.DRAFT:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Message {message_id} is not a draft (status: {message.status})"
+        )
 
-        message.body = request.body
-        session.commit()
+    message.body = request.body
+    await session.commit()
 
-        return UpdateDraftResponse(
-            message_id=message_id,
-            body=request.body,
-            updated=True,
-        )
+    invalidate("email_threads")
+
+    return UpdateDraftResponse(
+        message_id=message_id,
+        body=request.body,
+        updated=True,
+    )
 
 
 @router.post("/messages/{message_id}/send", response_model=SendDraftResponse)
 async def send_draft_message(
     message_id: str,
+    session: DbSessionDep,
+    resend_client: ResendClientDep,
 ) -> SendDraftResponse:
     """Send a draft message via Resend API.
 
@@ -147,70 +159,70 @@ async def send_draft_message(
     Returns:
         Send result with success/error status
     """
-    import json
+    # Load message, thread and case in one joined query - lazy loads are
+    # not allowed on AsyncSession
+    message = (
+        await session.execute(
+            select(DbMessage)
+            .options(joinedload(DbMessage.thread).joinedload(DbEmailThread.case))
+            .where(DbMessage.message_id == message_id)
+        )
+    ).scalar_one_or_none()
+
+    if message is None:
+        raise HTTPException(status_code=404, detail=f"Message {message_id} not found")
+
+    if message.status != MessageStatusEnum.DRAFT:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Message {message_id} is not a draft (status: {message.status})"
+        )
+
+    # Get thread for subject
+    thread = message.thread
+    if thread is None:
+        raise HTTPException(status_code=500, detail="Message has no associated thread")
+
+    to_emails = message.to_emails or []
+
+    if not to_emails:
+        raise HTTPException(status_code=400, detail="No recipients specified")
+
+    # Send via Resend API
+    if "Authorization" not in resend_client.headers:
+        raise HTTPException(status_code=500, detail="RESEND_API_KEY not configured")
+
+    try:
+        response = await resend_client.post("/emails", json={
+            "from": FROM_EMAIL,
+            "to": to_emails,
+            "subject": thread.subject,
+            "text": message.body,
+        })
+        response.raise_for_status()
+
+        # Update message status to sent
+        message.status = MessageStatusEnum.SENT
+        message.sent_at = datetime.now()
 
-    with get_session() as session:
-        message = (
-            session.query(DbMessage)
-            .filter(DbMessage.message_id == message_id)
-            .first()
+        # Update case status from hitl_review to pending_reply
+        case = thread.case
+        if case and case.status == CaseStatus.HITL_REVIEW:
+            case.status = CaseStatus.PENDING_REPLY
+
+        await session.commit()
+
+        invalidate("email_threads", "cases")
+        invalidate_case_cache()
+
+        return SendDraftResponse(
+            message_id=message_id,
+            sent=True,
         )
 
-        if message is None:
-            raise HTTPException(status_code=404, detail=f"Message {message_id} not found")
-
-        if message.status != MessageStatusEnum.DRAFT:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Message {message_id} is not a draft (status: {message.status})"
-            )
-
-        # Get thread for subject
-        thread = message.thread
-        if thread is None:
-            raise HTTPException(status_code=500, detail="Message has no associated thread")
-
-        # Parse to_emails JSON
-        to_emails = json.loads(message.to_emails) if message.to_emails else []
-        
-        if not to_emails:
-            raise HTTPException(status_code=400, detail="No recipients specified")
-
-        # Send via Resend API
-        if not resend.api_key:
-            raise HTTPException(status_code=500, detail="RESEND_API_KEY not configured")
-
-        try:
-            result = resend.Emails.send({
-                "from": FROM_EMAIL,
-                "to": to_emails,
-                "subject": thread.subject,
-                "text": message.body,
-            })
-
-            # Update message status to sent
-            message.status = MessageStatusEnum.SENT
-            message.sent_at = datetime.now()
-
-            # Update case status from hitl_review to pending_reply
-            case = (
-                session.query(DbCase)
-                .filter(DbCase.case_id == thread.case_id)
-                .first()
-            )
-            if case and case.status == CaseStatus.HITL_REVIEW:
-                case.status = CaseStatus.PENDING_REPLY
-
-            session.commit()
-
-            return SendDraftResponse(
-                message_id=message_id,
-                sent=True,
-            )
-
-        except Exception as e:
-            return SendDraftResponse(
-                message_id=message_id,
-                sent=False,
-                error=str(e),
-            )
+    except Exception as e:
+        return SendDraftResponse(
+            message_id=message_id,
+            sent=False,
+            error=str(e),
+        )
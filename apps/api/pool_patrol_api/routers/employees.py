@@ -1,12 +1,16 @@
 """Employee API routes."""
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
+from pydantic import TypeAdapter
 
 from pool_patrol_api.dependencies import DataServiceDep
+from pool_patrol_api.services.response_cache import cached_json_response
 from core.models import Employee, EmployeeStatus, Shifts
 
 router = APIRouter(prefix="/api/employees", tags=["employees"])
 
+_EMPLOYEE_LIST_ADAPTER = TypeAdapter(tuple[Employee, ...])
+
 
 @router.get("", response_model=list[Employee])
 async def list_employees(
@@ -14,14 +18,20 @@ async def list_employees(
     status: EmployeeStatus | None = Query(None, description="Filter by employee status"),
     work_site: str | None = Query(None, description="Filter by work site (partial match)"),
     vanpool_id: str | None = Query(None, description="Filter by vanpool membership"),
-) -> list[Employee]:
+) -> Response:
     """List all employees with optional filtering.
 
     - **status**: Filter by employee status (active, inactive, on_leave)
     - **work_site**: Filter by work site name (case-insensitive partial match)
     - **vanpool_id**: Filter to only employees in a specific vanpool
     """
-    return data_service.get_employees(status=status, work_site=work_site, vanpool_id=vanpool_id)
+    return cached_json_response(
+        ("employees", status, work_site, vanpool_id),
+        _EMPLOYEE_LIST_ADAPTER,
+        lambda: data_service.get_employees(
+            status=status, work_site=work_site, vanpool_id=vanpool_id
+        ),
+    )
 
 
 @router.get("/{employee_id}", response_model=Employee)
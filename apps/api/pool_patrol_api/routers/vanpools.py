@@ -1,13 +1,22 @@
 """Vanpool API routes."""
 
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Query, Response
+from pydantic import BaseModel, TypeAdapter
 
 from pool_patrol_api.dependencies import DataServiceDep
+from pool_patrol_api.services.response_cache import cached_json_response, invalidate
 from core.models import Rider, Vanpool, VanpoolStatus
 
 router = APIRouter(prefix="/api/vanpools", tags=["vanpools"])
 
+# Cap concurrent audits so a burst can't exhaust worker threads / LLM quota
+MAX_CONCURRENT_AUDITS = 4
+_audit_semaphore = asyncio.Semaphore(MAX_CONCURRENT_AUDITS)
+
+_VANPOOL_LIST_ADAPTER = TypeAdapter(tuple[Vanpool, ...])
+
 
 # =============================================================================
 # Response Models
@@ -30,13 +39,17 @@ async def list_vanpools(
     data_service: DataServiceDep,
     status: VanpoolStatus | None = Query(None, description="Filter by vanpool status"),
     work_site: str | None = Query(None, description="Filter by work site (partial match)"),
-) -> list[Vanpool]:
+) -> Response:
     """List all vanpools with optional filtering.
 
     - **status**: Filter by vanpool status (active, inactive, suspended)
     - **work_site**: Filter by work site name (case-insensitive partial match)
     """
-    return data_service.get_vanpools(status=status, work_site=work_site)
+    return cached_json_response(
+        ("vanpools", status, work_site),
+        _VANPOOL_LIST_ADAPTER,
+        lambda: data_service.get_vanpools(status=status, work_site=work_site),
+    )
 
 
 @router.get("/{vanpool_id}", response_model=Vanpool)
@@ -81,7 +94,13 @@ async def audit_vanpool(vanpool_id: str) -> AuditResponse:
 
     # Run the case manager agent (it uses the real database, not mock data)
     request = CaseManagerRequest(vanpool_id=vanpool_id)
-    result = investigate_vanpool_sync(request)
+    # The investigation is blocking; run it off the event loop so other
+    # endpoints keep serving while an audit is in progress
+    async with _audit_semaphore:
+        result = await asyncio.to_thread(investigate_vanpool_sync, request)
+
+    # The audit may create/update cases, threads, and vanpool status
+    invalidate("cases", "vanpools", "email_threads")
 
     return AuditResponse(
         vanpool_id=result.vanpool_id,
@@ -1,9 +1,19 @@
 """Data service for loading and querying mock data."""
 
-import json
-from functools import lru_cache
+import os
+import pickle
+import tempfile
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import compress
 from pathlib import Path
+from typing import TypeVar
 
+import orjson
+import pydantic
+from pydantic import TypeAdapter
+
+import core.models
 from core.models import (
     Case,
     CaseStatus,
@@ -19,9 +29,42 @@ from core.models import (
     VanpoolStatus,
 )
 
+T = TypeVar("T")
+
+# Project's mock/ folder (apps/api/pool_patrol_api/services -> project root)
+_DEFAULT_MOCK_PATH = Path(__file__).resolve().parents[4] / "mock"
+
+# Bump when the build transforms below change the shape of cached values
+_CACHE_VERSION = 1
+
+# Model definitions and this module's transforms; pickled caches are stale
+# whenever either file changes
+_MODELS_FILE = Path(core.models.__file__)
+_SERVICE_FILE = Path(__file__)
+
+# Whole-file validators: parse + validate each file in one pydantic-core call.
+# They produce tuples so the shared records can't be mutated by callers.
+_SHIFTS_ADAPTER = TypeAdapter(tuple[Shift, ...])
+_VANPOOLS_ADAPTER = TypeAdapter(tuple[Vanpool, ...])
+_EMPLOYEES_ADAPTER = TypeAdapter(tuple[Employee, ...])
+_CASES_ADAPTER = TypeAdapter(tuple[Case, ...])
+_EMAIL_THREADS_ADAPTER = TypeAdapter(tuple[EmailThread, ...])
+
+
+def _mtime_ns(path: Path) -> int | None:
+    """Return a file's mtime in nanoseconds, or None if it doesn't exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
 
 class DataService:
-    """Service for accessing mock data with query capabilities."""
+    """Service for accessing mock data with query capabilities.
+
+    Collections are returned as tuples: they are shared, read-only snapshots
+    of the loaded data, so callers can't mutate them by accident.
+    """
 
     def __init__(self, mock_data_path: Path | None = None):
         """Initialize the data service.
@@ -30,96 +73,259 @@ class DataService:
             mock_data_path: Path to the mock data directory.
                            Defaults to the project's mock/ folder.
         """
-        if mock_data_path is None:
-            # Navigate from apps/api/pool_patrol_api/services to project root
-            self._mock_path = Path(__file__).parent.parent.parent.parent.parent / "mock"
-        else:
-            self._mock_path = mock_data_path
+        self._mock_path = mock_data_path or _DEFAULT_MOCK_PATH
 
         # Load data on initialization
         self._shifts: dict[str, Shift] = {}  # Shift templates by ID
-        self._vanpools: list[Vanpool] = []
-        self._employees: list[Employee] = []
-        self._cases: list[Case] = []
-        self._email_threads: list[EmailThread] = []
+        self._vanpools: tuple[Vanpool, ...] = ()
+        self._employees: tuple[Employee, ...] = ()
+        self._cases: tuple[Case, ...] = ()
+        self._email_threads: tuple[EmailThread, ...] = ()
+
+        # ID indexes for O(1) lookups (built after loading)
+        self._vanpools_by_id: dict[str, Vanpool] = {}
+        self._employees_by_id: dict[str, Employee] = {}
+        self._employees_by_email: dict[str, Employee] = {}
+        self._cases_by_id: dict[str, Case] = {}
+        self._threads_by_id: dict[str, EmailThread] = {}
+        self._threads_by_case_id: dict[str, tuple[EmailThread, ...]] = {}
+
+        # Filter indexes: status/vanpool buckets and case-folded work sites.
+        # Status buckets are keyed by the enum's plain string value.
+        self._vanpools_by_status: dict[str, tuple[Vanpool, ...]] = {}
+        self._employees_by_status: dict[str, tuple[Employee, ...]] = {}
+        self._cases_by_status: dict[str, tuple[Case, ...]] = {}
+        self._cases_by_vanpool_id: dict[str, tuple[Case, ...]] = {}
+        self._threads_by_status: dict[str, tuple[EmailThread, ...]] = {}
+        self._threads_by_vanpool_id: dict[str, tuple[EmailThread, ...]] = {}
+        self._work_site_folded: dict[str, str] = {}  # work_site -> work_site.casefold()
+
+        # Case-folded work-site columns parallel to each status bucket (None = all),
+        # so work_site filters scan plain strings instead of model attributes
+        self._vanpool_sites: dict[str | None, tuple[str, ...]] = {}
+        self._employee_sites: dict[str | None, tuple[str, ...]] = {}
 
         self._load_all_data()
 
     def _load_all_data(self) -> None:
-        """Load all mock data files."""
-        self._load_shifts()  # Load shifts first (needed for employee transformation)
-        self._load_vanpools()
+        """Load all mock data files.
+
+        The files are independent apart from employees needing shifts, so
+        they're loaded concurrently; each loader only sets its own attribute.
+        """
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(self._load_shifts_and_employees),
+                executor.submit(self._load_vanpools),
+                executor.submit(self._load_cases),
+                executor.submit(self._load_email_threads),
+            ]
+            for future in futures:
+                future.result()
+        self._build_indexes()
+
+    def _load_shifts_and_employees(self) -> None:
+        """Load shifts, then employees (which embed shift templates)."""
+        self._load_shifts()
         self._load_employees()
-        self._load_cases()
-        self._load_email_threads()
+
+    def _build_indexes(self) -> None:
+        """Build lookup and filter indexes over the loaded data.
+
+        setdefault keeps the first record on duplicate IDs, matching the
+        first-match behavior of a linear scan. Buckets preserve load order
+        and are stored as tuples.
+        """
+        for vanpool in self._vanpools:
+            self._vanpools_by_id.setdefault(vanpool.vanpool_id, vanpool)
+            self._vanpools_by_status.setdefault(vanpool.status.value, []).append(vanpool)
+            self._work_site_folded.setdefault(vanpool.work_site, vanpool.work_site.casefold())
+        for employee in self._employees:
+            self._employees_by_id.setdefault(employee.employee_id, employee)
+            self._employees_by_email.setdefault(employee.email, employee)
+            self._employees_by_status.setdefault(employee.status.value, []).append(employee)
+            self._work_site_folded.setdefault(employee.work_site, employee.work_site.casefold())
+        for case in self._cases:
+            self._cases_by_id.setdefault(case.case_id, case)
+            self._cases_by_status.setdefault(case.status.value, []).append(case)
+            self._cases_by_vanpool_id.setdefault(case.vanpool_id, []).append(case)
+        for thread in self._email_threads:
+            self._threads_by_id.setdefault(thread.thread_id, thread)
+            self._threads_by_case_id.setdefault(thread.case_id, []).append(thread)
+            self._threads_by_status.setdefault(thread.status.value, []).append(thread)
+            self._threads_by_vanpool_id.setdefault(thread.vanpool_id, []).append(thread)
+
+        # Freeze buckets so callers get read-only snapshots
+        for buckets in (
+            self._vanpools_by_status,
+            self._employees_by_status,
+            self._cases_by_status,
+            self._cases_by_vanpool_id,
+            self._threads_by_case_id,
+            self._threads_by_status,
+            self._threads_by_vanpool_id,
+        ):
+            for key, items in buckets.items():
+                buckets[key] = tuple(items)
+
+        site_folded = self._work_site_folded
+        self._vanpool_sites[None] = tuple(site_folded[v.work_site] for v in self._vanpools)
+        for status, vanpools in self._vanpools_by_status.items():
+            self._vanpool_sites[status] = tuple(site_folded[v.work_site] for v in vanpools)
+        self._employee_sites[None] = tuple(site_folded[e.work_site] for e in self._employees)
+        for status, employees in self._employees_by_status.items():
+            self._employee_sites[status] = tuple(site_folded[e.work_site] for e in employees)
+
+    @staticmethod
+    def _filter_by_site(
+        records: tuple[T, ...], sites: tuple[str, ...], work_site: str
+    ) -> tuple[T, ...]:
+        """Keep records whose case-folded work site (parallel column) contains work_site."""
+        needle = work_site.casefold()
+        return tuple(compress(records, [needle in site for site in sites]))
+
+    def _load_cached(self, source: Path, build: Callable[[bytes], T], *depends_on: Path) -> T:
+        """Load models from a pickle sidecar, rebuilding from JSON when stale.
+
+        The sidecar (e.g. mock/.vanpools.pkl) stores a stamp alongside the
+        built models: the cache and pydantic versions plus the mtimes of the
+        source file, any dependencies, core/models.py and this module. Warm
+        starts skip JSON parsing and Pydantic validation entirely.
+        Cache read/write failures fall back to building from JSON.
+        Raises FileNotFoundError if source doesn't exist.
+
+        Args:
+            source: JSON file to load
+            build: Callable turning the raw JSON bytes into models
+            depends_on: Other files the built value depends on
+
+        Returns:
+            The built (or cached) value
+        """
+        cache_file = source.with_name(f".{source.stem}.pkl")
+        # Stat the source directly (no exists() check); missing files raise here
+        stamp = (
+            _CACHE_VERSION,
+            pydantic.VERSION,
+            source.stat().st_mtime_ns,
+            *(_mtime_ns(p) for p in (*depends_on, _MODELS_FILE, _SERVICE_FILE)),
+        )
+
+        try:
+            cached_stamp, value = pickle.loads(cache_file.read_bytes())
+            if cached_stamp == stamp:
+                return value
+        except Exception:
+            # Missing, torn, or incompatible cache - rebuild below
+            pass
+
+        value = build(source.read_bytes())
+        # Write a temp file and rename it into place, so other workers never
+        # read a half-written cache
+        try:
+            fd, tmp_name = tempfile.mkstemp(
+                dir=cache_file.parent, prefix=f"{cache_file.stem}.", suffix=".tmp.pkl"
+            )
+            try:
+                with os.fdopen(fd, "wb") as tmp:
+                    tmp.write(pickle.dumps((stamp, value), protocol=5))
+                os.replace(tmp_name, cache_file)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError:
+            pass
+        return value
 
     def _load_shifts(self) -> None:
         """Load shift templates from JSON file."""
-        shifts_file = self._mock_path / "shifts.json"
-        if shifts_file.exists():
-            with open(shifts_file) as f:
-                data = json.load(f)
-                self._shifts = {item["id"]: Shift(**item) for item in data}
+        try:
+            self._shifts = self._load_cached(self._mock_path / "shifts.json", self._build_shifts)
+        except FileNotFoundError:
+            pass
+
+    def _build_shifts(self, raw: bytes) -> dict[str, Shift]:
+        """Build shift templates keyed by ID from raw JSON."""
+        return {shift.id: shift for shift in _SHIFTS_ADAPTER.validate_json(raw)}
 
     def _load_vanpools(self) -> None:
         """Load vanpools from JSON file."""
-        vanpools_file = self._mock_path / "vanpools.json"
-        if vanpools_file.exists():
-            with open(vanpools_file) as f:
-                data = json.load(f)
-                self._vanpools = [Vanpool(**item) for item in data]
+        try:
+            self._vanpools = self._load_cached(
+                self._mock_path / "vanpools.json", self._build_vanpools
+            )
+        except FileNotFoundError:
+            pass
+
+    def _build_vanpools(self, raw: bytes) -> tuple[Vanpool, ...]:
+        """Build vanpools from raw JSON."""
+        return _VANPOOLS_ADAPTER.validate_json(raw)
 
     def _load_employees(self) -> None:
-        """Load employees from JSON file.
-        
+        """Load employees from JSON file."""
+        try:
+            # Employees embed shift templates, so shifts.json invalidates them too
+            self._employees = self._load_cached(
+                self._mock_path / "employees.json",
+                self._build_employees,
+                self._mock_path / "shifts.json",
+            )
+        except FileNotFoundError:
+            pass
+
+    def _build_employees(self, raw: bytes) -> tuple[Employee, ...]:
+        """Build employees from raw JSON.
+
         Transforms the raw employee data by combining shift_id + pto_dates
         into a proper Shifts object.
         """
-        employees_file = self._mock_path / "employees.json"
-        if employees_file.exists():
-            with open(employees_file) as f:
-                data = json.load(f)
-                
-                employees = []
-                for item in data:
-                    # Transform shift_id + pto_dates into shifts object
-                    shift_id = item.pop("shift_id", None)
-                    pto_dates = item.pop("pto_dates", [])
-                    
-                    if shift_id and shift_id in self._shifts:
-                        shift_template = self._shifts[shift_id]
-                        item["shifts"] = Shifts(
-                            type=shift_template.name,
-                            schedule=shift_template.schedule,
-                            pto_dates=pto_dates,
-                        )
-                    else:
-                        # Fallback: create empty shifts if no template found
-                        item["shifts"] = Shifts(
-                            type="Unknown",
-                            schedule=[],
-                            pto_dates=pto_dates,
-                        )
-                    
-                    employees.append(Employee(**item))
-                
-                self._employees = employees
+        data = orjson.loads(raw)
+
+        for item in data:
+            # Transform shift_id + pto_dates into shifts object
+            shift_id = item.pop("shift_id", None)
+            pto_dates = item.pop("pto_dates", [])
+
+            if shift_id and shift_id in self._shifts:
+                shift_template = self._shifts[shift_id]
+                item["shifts"] = Shifts(
+                    type=shift_template.name,
+                    schedule=shift_template.schedule,
+                    pto_dates=pto_dates,
+                )
+            else:
+                # Fallback: create empty shifts if no template found
+                item["shifts"] = Shifts(
+                    type="Unknown",
+                    schedule=[],
+                    pto_dates=pto_dates,
+                )
+
+        return _EMPLOYEES_ADAPTER.validate_python(data)
 
     def _load_cases(self) -> None:
         """Load cases from JSON file."""
-        cases_file = self._mock_path / "cases.json"
-        if cases_file.exists():
-            with open(cases_file) as f:
-                data = json.load(f)
-                self._cases = [Case(**item) for item in data]
+        try:
+            self._cases = self._load_cached(self._mock_path / "cases.json", self._build_cases)
+        except FileNotFoundError:
+            pass
+
+    def _build_cases(self, raw: bytes) -> tuple[Case, ...]:
+        """Build cases from raw JSON."""
+        return _CASES_ADAPTER.validate_json(raw)
 
     def _load_email_threads(self) -> None:
         """Load email threads from JSON file."""
-        email_threads_file = self._mock_path / "email_threads.json"
-        if email_threads_file.exists():
-            with open(email_threads_file) as f:
-                data = json.load(f)
-                self._email_threads = [EmailThread(**item) for item in data]
+        try:
+            self._email_threads = self._load_cached(
+                self._mock_path / "email_threads.json", self._build_email_threads
+            )
+        except FileNotFoundError:
+            pass
+
+    def _build_email_threads(self, raw: bytes) -> tuple[EmailThread, ...]:
+        """Build email threads from raw JSON."""
+        return _EMAIL_THREADS_ADAPTER.validate_json(raw)
 
     # =========================================================================
     # Vanpool Methods
@@ -129,24 +335,24 @@ class DataService:
         self,
         status: VanpoolStatus | None = None,
         work_site: str | None = None,
-    ) -> list[Vanpool]:
+    ) -> tuple[Vanpool, ...]:
         """Get all vanpools with optional filtering.
 
         Args:
             status: Filter by vanpool status
-            work_site: Filter by work site name (partial match)
+            work_site: Filter by work site name (case-insensitive partial match)
 
         Returns:
-            List of vanpools matching the filters
+            Tuple of vanpools matching the filters
         """
-        result = self._vanpools
-
-        if status is not None:
-            result = [v for v in result if v.status == status]
+        status_value = status.value if status is not None else None
+        if status_value is not None:
+            result = self._vanpools_by_status.get(status_value, ())
+        else:
+            result = self._vanpools
 
-        if work_site is not None:
-            work_site_lower = work_site.lower()
-            result = [v for v in result if work_site_lower in v.work_site.lower()]
+        if work_site is not None and result:
+            result = self._filter_by_site(result, self._vanpool_sites[status_value], work_site)
 
         return result
 
@@ -159,10 +365,7 @@ class DataService:
         Returns:
             The vanpool if found, None otherwise
         """
-        for vanpool in self._vanpools:
-            if vanpool.vanpool_id == vanpool_id:
-                return vanpool
-        return None
+        return self._vanpools_by_id.get(vanpool_id)
 
     def get_vanpool_riders(self, vanpool_id: str) -> list[Rider] | None:
         """Get riders for a specific vanpool.
@@ -187,33 +390,46 @@ class DataService:
         status: EmployeeStatus | None = None,
         work_site: str | None = None,
         vanpool_id: str | None = None,
-    ) -> list[Employee]:
+    ) -> tuple[Employee, ...]:
         """Get all employees with optional filtering.
 
         Args:
             status: Filter by employee status
-            work_site: Filter by work site name (partial match)
+            work_site: Filter by work site name (case-insensitive partial match)
             vanpool_id: Filter by vanpool membership
 
         Returns:
-            List of employees matching the filters
+            Tuple of employees matching the filters
         """
-        result = self._employees
-
-        if status is not None:
-            result = [e for e in result if e.status == status]
-
-        if work_site is not None:
-            work_site_lower = work_site.lower()
-            result = [e for e in result if work_site_lower in e.work_site.lower()]
-
+        status_value = status.value if status is not None else None
         if vanpool_id is not None:
-            # Get rider emails for this vanpool
+            # Start from the vanpool's riders (R << E) via the email index
             vanpool = self.get_vanpool(vanpool_id)
             if vanpool is None:
-                return []
-            rider_emails = {r.email for r in vanpool.riders}
-            result = [e for e in result if e.email in rider_emails]
+                return ()
+            members = []
+            seen: set[str] = set()
+            for rider in vanpool.riders:
+                employee = self._employees_by_email.get(rider.email)
+                if employee is not None and employee.employee_id not in seen:
+                    seen.add(employee.employee_id)
+                    members.append(employee)
+            result = tuple(members)
+            if status_value is not None:
+                result = tuple(e for e in result if e.status == status_value)
+            if work_site is not None:
+                site_folded = self._work_site_folded
+                sites = tuple(site_folded[e.work_site] for e in result)
+                result = self._filter_by_site(result, sites, work_site)
+            return result
+
+        if status_value is not None:
+            result = self._employees_by_status.get(status_value, ())
+        else:
+            result = self._employees
+
+        if work_site is not None and result:
+            result = self._filter_by_site(result, self._employee_sites[status_value], work_site)
 
         return result
 
@@ -226,10 +442,7 @@ class DataService:
         Returns:
             The employee if found, None otherwise
         """
-        for employee in self._employees:
-            if employee.employee_id == employee_id:
-                return employee
-        return None
+        return self._employees_by_id.get(employee_id)
 
     def get_employee_by_email(self, email: str) -> Employee | None:
         """Get a single employee by email.
@@ -240,10 +453,7 @@ class DataService:
         Returns:
             The employee if found, None otherwise
         """
-        for employee in self._employees:
-            if employee.email == email:
-                return employee
-        return None
+        return self._employees_by_email.get(email)
 
     def get_employee_shifts(self, employee_id: str) -> Shifts | None:
         """Get shifts for a specific employee.
@@ -267,7 +477,7 @@ class DataService:
         self,
         status: CaseStatus | None = None,
         vanpool_id: str | None = None,
-    ) -> list[Case]:
+    ) -> tuple[Case, ...]:
         """Get all cases with optional filtering.
 
         Args:
@@ -275,17 +485,19 @@ class DataService:
             vanpool_id: Filter by vanpool ID
 
         Returns:
-            List of cases matching the filters
+            Tuple of cases matching the filters
         """
-        result = self._cases
+        if vanpool_id is not None:
+            result = self._cases_by_vanpool_id.get(vanpool_id, ())
+            if status is not None:
+                status_value = status.value
+                result = tuple(c for c in result if c.status == status_value)
+            return result
 
         if status is not None:
-            result = [c for c in result if c.status == status]
-
-        if vanpool_id is not None:
-            result = [c for c in result if c.vanpool_id == vanpool_id]
+            return self._cases_by_status.get(status.value, ())
 
-        return result
+        return self._cases
 
     def get_case(self, case_id: str) -> Case | None:
         """Get a single case by ID.
@@ -296,21 +508,29 @@ class DataService:
         Returns:
             The case if found, None otherwise
         """
-        for case in self._cases:
-            if case.case_id == case_id:
-                return case
-        return None
+        return self._cases_by_id.get(case_id)
 
-    def get_case_emails(self, case_id: str) -> list[EmailThread]:
+    def has_case(self, case_id: str) -> bool:
+        """Check whether a case exists without fetching it.
+
+        Args:
+            case_id: The case ID to look up
+
+        Returns:
+            True if the case exists
+        """
+        return case_id in self._cases_by_id
+
+    def get_case_emails(self, case_id: str) -> tuple[EmailThread, ...]:
         """Get email threads for a specific case.
 
         Args:
             case_id: The case ID to look up
 
         Returns:
-            List of email threads for the case
+            Tuple of email threads for the case
         """
-        return [t for t in self._email_threads if t.case_id == case_id]
+        return self._threads_by_case_id.get(case_id, ())
 
     # =========================================================================
     # Email Thread Methods
@@ -320,7 +540,7 @@ class DataService:
         self,
         status: ThreadStatus | None = None,
         vanpool_id: str | None = None,
-    ) -> list[EmailThread]:
+    ) -> tuple[EmailThread, ...]:
         """Get all email threads with optional filtering.
 
         Args:
@@ -328,17 +548,19 @@ class DataService:
             vanpool_id: Filter by vanpool ID
 
         Returns:
-            List of email threads matching the filters
+            Tuple of email threads matching the filters
         """
-        result = self._email_threads
+        if vanpool_id is not None:
+            result = self._threads_by_vanpool_id.get(vanpool_id, ())
+            if status is not None:
+                status_value = status.value
+                result = tuple(t for t in result if t.status == status_value)
+            return result
 
         if status is not None:
-            result = [t for t in result if t.status == status]
+            return self._threads_by_status.get(status.value, ())
 
-        if vanpool_id is not None:
-            result = [t for t in result if t.vanpool_id == vanpool_id]
-
-        return result
+        return self._email_threads
 
     def get_email_thread(self, thread_id: str) -> EmailThread | None:
         """Get a single email thread by ID.
@@ -349,10 +571,7 @@ class DataService:
         Returns:
             The email thread if found, None otherwise
         """
-        for thread in self._email_threads:
-            if thread.thread_id == thread_id:
-                return thread
-        return None
+        return self._threads_by_id.get(thread_id)
 
     def get_thread_messages(self, thread_id: str) -> list[Message] | None:
         """Get messages for a specific email thread.
@@ -367,13 +586,3 @@ class DataService:
         if thread is None:
             return None
         return thread.messages
-
-
-@lru_cache
-def get_data_service() -> DataService:
-    """Get a cached instance of the data service.
-
-    Returns:
-        Singleton DataService instance
-    """
-    return DataService()
@@ -0,0 +1,35 @@
+"""Async HTTP client for the Resend email API.
+
+One client is created per worker at startup and shared by all requests, so
+sends reuse pooled (HTTP/2) connections instead of paying a TLS handshake
+each time, and never block the event loop.
+"""
+
+import os
+
+import httpx
+
+RESEND_API_URL = "https://api.resend.com"
+RESEND_TIMEOUT_SECONDS = 15.0
+
+
+def create_resend_client(api_key: str | None = None) -> httpx.AsyncClient:
+    """Create the shared Resend client.
+
+    Args:
+        api_key: Resend API key (defaults to RESEND_API_KEY from the environment)
+
+    Returns:
+        AsyncClient with the Resend base URL and auth header configured.
+        The Authorization header is omitted when no key is set.
+    """
+    if api_key is None:
+        api_key = os.environ.get("RESEND_API_KEY", "")
+
+    headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+    return httpx.AsyncClient(
+        base_url=RESEND_API_URL,
+        headers=headers,
+        http2=True,
+        timeout=RESEND_TIMEOUT_SECONDS,
+    )
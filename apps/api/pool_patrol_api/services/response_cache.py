@@ -0,0 +1,52 @@
+"""Short-lived cache for serialized list endpoint responses.
+
+List endpoints are read-heavy and their data rarely changes within a few
+seconds, so the JSON body is cached keyed on the query filters. Cache hits
+return the stored bytes directly, skipping the data scan and response_model
+serialization. Misses serialize the already-validated models in one
+`TypeAdapter.dump_json` call rather than re-validating each row, so list
+routes keep `response_model` only for the OpenAPI schema.
+Mutating routes call `invalidate()` for the namespaces they touch.
+"""
+
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from core.cache import TTLCache
+
+RESPONSE_CACHE_TTL_SECONDS = 10
+RESPONSE_CACHE_MAX_ENTRIES = 256
+
+response_cache = TTLCache(maxsize=RESPONSE_CACHE_MAX_ENTRIES, ttl=RESPONSE_CACHE_TTL_SECONDS)
+
+
+def cached_json_response(
+    key: tuple[Hashable, ...],
+    adapter: TypeAdapter,
+    build: Callable[[], Any],
+) -> Response:
+    """Return a cached JSON response for key, building and caching it on a miss.
+
+    Args:
+        key: Cache key; the first element is the namespace used for invalidation
+        adapter: TypeAdapter used to serialize the built value
+        build: Callable producing the value to serialize
+
+    Returns:
+        JSON response with the serialized body
+    """
+    body = response_cache.get(key)
+    if body is None:
+        # by_alias matches FastAPI's response_model serialization
+        body = adapter.dump_json(build(), by_alias=True)
+        response_cache.set(key, body)
+    return Response(content=body, media_type="application/json")
+
+
+def invalidate(*namespaces: str) -> None:
+    """Drop cached responses for the given namespaces."""
+    for namespace in namespaces:
+        response_cache.clear(namespace)
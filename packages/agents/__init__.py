@@ -14,11 +14,14 @@ from .structures import (
 from .shift_specialist import (
     verify_employee_shifts,
     verify_employee_shifts_sync,
+    verify_employee_shifts_batch,
     compile_shift_specialist,
 )
 from .outreach import (
     handle_outreach,
     handle_outreach_sync,
+    handle_outreach_batch,
+    handle_outreach_stream,
     create_outreach_agent,
 )
 from .case_manager import (
@@ -44,10 +47,13 @@ __all__ = [
     # Shift Specialist
     "verify_employee_shifts",
     "verify_employee_shifts_sync",
+    "verify_employee_shifts_batch",
     "compile_shift_specialist",
     # Outreach Agent
     "handle_outreach",
     "handle_outreach_sync",
+    "handle_outreach_batch",
+    "handle_outreach_stream",
     "create_outreach_agent",
     # Case Manager Agent
     "investigate_vanpool",
@@ -10,35 +10,42 @@ The agent uses a ReAct pattern for flexible reasoning and can explain
 its decisions when asked "why did this case fail?"
 """
 
-import json
 import os
+import threading
+import time
 import uuid
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
-from langchain.agents import create_agent
-from langchain.agents.middleware import HumanInTheLoopMiddleware
+import orjson
 from langchain_core.messages import HumanMessage
-from langchain_openai import ChatOpenAI
-from langgraph.checkpoint.memory import InMemorySaver
 from langsmith import traceable
+from sqlalchemy import bindparam, select
 
 from agents.structures import CaseManagerRequest, CaseManagerResult, CaseManagerResultWithTrajectory
-from agents.utils import configure_langsmith
-from core.database import get_session
+from agents.utils import (
+    arelease_thread,
+    configure_langsmith,
+    create_checkpointer,
+    release_thread,
+)
+from core.database import get_session, session_scope
 from core.db_models import Case, CaseStatus
 from prompts.case_manager_prompts import CASE_MANAGER_PROMPT, CASE_MANAGER_PROMPT_VERSION
 from tools.case_manager_tools import (
+    cached_case_lookup,
     cancel_membership,
     close_case,
-    get_case_status,  # Used for preloading only, not as agent tool
-    upsert_case,
+    get_cached_case_status,  # Used for preloading only, not as agent tool
     run_location_specialist,
     run_outreach,
     run_shift_specialist,
+    upsert_case,
 )
-from tools.vanpool import get_vanpool_roster
+from tools.vanpool import get_cached_vanpool_roster
 
 # Auto-configure LangSmith on import
 _langsmith_enabled = configure_langsmith()
@@ -49,6 +56,7 @@ _langsmith_enabled = configure_langsmith()
 # =============================================================================
 
 OUTREACH_TIMEOUT = timedelta(weeks=1)
+_OUTREACH_TIMEOUT_SECONDS = OUTREACH_TIMEOUT.total_seconds()
 
 
 # =============================================================================
@@ -67,8 +75,12 @@ TOOLS = [
 ]
 
 
+@lru_cache(maxsize=1)
 def get_model():
-    """Get the LLM model for the agent."""
+    """Get the LLM model for the agent (built once per process)."""
+    # Deferred so importing this module (e.g. to parse results) skips the OpenAI client
+    from langchain_openai import ChatOpenAI
+
     return ChatOpenAI(
         model=os.environ.get("OPENAI_MODEL", "gpt-4.1"),
         temperature=0,
@@ -84,6 +96,10 @@ def create_case_manager_agent():
     Returns:
         A LangGraph agent that can manage investigation cases.
     """
+    # Deferred: only needed when an agent is actually built
+    from langchain.agents import create_agent
+    from langchain.agents.middleware import HumanInTheLoopMiddleware
+
     model = get_model()
 
     # Create the agent with HITL middleware and enforced response schema
@@ -91,7 +107,7 @@ def create_case_manager_agent():
         model=model,
         tools=TOOLS,
         system_prompt=CASE_MANAGER_PROMPT,
-        checkpointer=InMemorySaver(),
+        checkpointer=create_checkpointer(),
         response_format=CaseManagerResult,  # Enforces deterministic JSON output
         middleware=[
             HumanInTheLoopMiddleware(
@@ -108,6 +124,25 @@ def create_case_manager_agent():
     return agent
 
 
+_agent = None
+_agent_lock = threading.Lock()
+
+
+def _get_agent():
+    """Return the shared Case Manager agent, creating it on first use.
+
+    The graph, model client and checkpointer are request-independent, so
+    they're built once. Each run gets its own thread_id (see _build_config),
+    and sharing the checkpointer lets HITL resumes find their thread.
+    """
+    global _agent
+    if _agent is None:
+        with _agent_lock:
+            if _agent is None:
+                _agent = create_case_manager_agent()
+    return _agent
+
+
 # =============================================================================
 # Helper Functions
 # =============================================================================
@@ -120,20 +155,39 @@ def get_existing_case(vanpool_id: str) -> dict | None:
         vanpool_id: The vanpool ID to check
 
     Returns:
-        Case dictionary if an open case exists, None otherwise
+        Dictionary with case_id, status and created_at if an open case
+        exists, None otherwise. Includes a private "_created_at_ts" (epoch
+        seconds) used by check_timeout. Results are briefly cached and
+        dropped whenever a case tool writes.
     """
+    return cached_case_lookup(("open_case", vanpool_id), lambda: _query_existing_case(vanpool_id))
+
+
+# Open case for a vanpool: only the columns callers use, as a Core select
+# (plain rows, no ORM hydration) served by the (vanpool_id, status) index
+_OPEN_CASE_QUERY = (
+    select(Case.case_id, Case.status, Case.created_at)
+    .where(Case.vanpool_id == bindparam("vanpool_id"))
+    .where(Case.status.notin_([CaseStatus.RESOLVED, CaseStatus.CANCELLED]))
+    .limit(1)
+)
+
+
+def _query_existing_case(vanpool_id: str) -> dict | None:
+    """Query the open case for a vanpool (uncached get_existing_case)."""
     with get_session() as session:
-        case = (
-            session.query(Case)
-            .filter(Case.vanpool_id == vanpool_id)
-            .filter(Case.status.notin_([CaseStatus.RESOLVED, CaseStatus.CANCELLED]))
-            .first()
-        )
+        row = session.execute(_OPEN_CASE_QUERY, {"vanpool_id": vanpool_id}).first()
 
-        if case is None:
-            return None
+    if row is None:
+        return None
 
-        return case.to_dict()
+    created_at = row.created_at
+    return {
+        "case_id": row.case_id,
+        "status": row.status,
+        "created_at": created_at.isoformat() if created_at else None,
+        "_created_at_ts": created_at.timestamp() if created_at else None,
+    }
 
 
 def check_timeout(case: dict | None) -> bool:
@@ -148,30 +202,44 @@ def check_timeout(case: dict | None) -> bool:
     if not case:
         return False
 
-    created_at_str = case.get("created_at")
-    if not created_at_str:
-        return False
+    # Fast path: epoch seconds precomputed by get_existing_case
+    created_at_ts = case.get("_created_at_ts")
+    if created_at_ts is None:
+        created_at_str = case.get("created_at")
+        if not created_at_str:
+            return False
+
+        try:
+            # Python 3.11+ parses a trailing "Z" natively
+            created_at = datetime.fromisoformat(created_at_str)
+        except (ValueError, TypeError):
+            return False
+        # Naive timestamps are treated as UTC
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=UTC)
+        created_at_ts = created_at.timestamp()
+
+    # Timed out once the case was created at or before the deadline
+    deadline_ts = time.time() - _OUTREACH_TIMEOUT_SECONDS
+    return created_at_ts <= deadline_ts
 
-    try:
-        created_at = datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
-        # Make both datetimes naive for comparison
-        if created_at.tzinfo is not None:
-            created_at = created_at.replace(tzinfo=None)
-        return (datetime.utcnow() - created_at) >= OUTREACH_TIMEOUT
-    except (ValueError, TypeError):
-        return False
+
+# Trace metadata shared by every run; the model name is read once, like get_model()
+_TRACE_METADATA = MappingProxyType({
+    "agent": "case_manager",
+    "prompt_version": CASE_MANAGER_PROMPT_VERSION,
+    "model": os.environ.get("OPENAI_MODEL", "gpt-4.1"),
+})
 
 
 def _build_config(vanpool_id: str, case_id: str | None) -> dict[str, Any]:
     """Build config with thread ID for persistence and LangSmith tracing.
 
-    Uses case_id for thread persistence (HITL resume) if available,
-    otherwise generates a new UUID.
+    Every run gets a fresh thread so the shared checkpointer never replays an
+    earlier run's messages (or its unanswered HITL tool calls) into this one.
+    The case_id prefix keeps threads traceable to their case.
     """
-    model_name = os.environ.get("OPENAI_MODEL", "gpt-4.1")
-
-    # Use case_id for thread persistence, else generate new UUID
-    thread_id = case_id or f"investigation-{uuid.uuid4()}"
+    thread_id = f"{case_id or 'investigation'}-{uuid.uuid4()}"
 
     return {
         # Thread config required for checkpointer persistence (LangGraph concept)
@@ -179,14 +247,31 @@ def _build_config(vanpool_id: str, case_id: str | None) -> dict[str, Any]:
             "thread_id": thread_id,
         },
         # LangSmith trace metadata
-        "metadata": {
-            "agent": "case_manager",
+        "metadata": {**_TRACE_METADATA, "vanpool_id": vanpool_id, "case_id": case_id},
+    }
+
+
+@lru_cache(maxsize=256)
+def _vanpool_summary_json(
+    vanpool_id: str | None,
+    work_site: str | None,
+    rider_count: int | None,
+    employee_ids: tuple[str, ...],
+) -> str:
+    """Serialize the vanpool summary for the preload message.
+
+    Cached on the vanpool and its roster, so repeated investigations of an
+    unchanged vanpool (e.g. HITL resumes) reuse the same string.
+    """
+    return orjson.dumps(
+        {
             "vanpool_id": vanpool_id,
-            "case_id": case_id,
-            "prompt_version": CASE_MANAGER_PROMPT_VERSION,
-            "model": model_name,
+            "work_site": work_site,
+            "rider_count": rider_count,
+            "employee_ids": employee_ids,
         },
-    }
+        default=str,
+    ).decode()
 
 
 @dataclass
@@ -214,47 +299,49 @@ def _preload_investigation_context(vanpool_id: str) -> PreloadedContext | CaseMa
             hitl_required=False,
         )
 
-    # Preload vanpool roster without tracing tool runs
-    vanpool_context = get_vanpool_roster.func(vanpool_id=vanpool_id)
+    # The roster, open-case and case-status lookups share one DB session
+    with session_scope():
+        # Preload vanpool roster without tracing tool runs (briefly cached)
+        vanpool_context = get_cached_vanpool_roster(vanpool_id)
 
-    if "error" in vanpool_context:
-        return CaseManagerResult(
-            vanpool_id=vanpool_id,
-            case_id=None,
-            outcome="error",
-            reasoning=f"Could not load vanpool: {vanpool_context['error']}",
-            hitl_required=False,
-        )
+        if "error" in vanpool_context:
+            return CaseManagerResult(
+                vanpool_id=vanpool_id,
+                case_id=None,
+                outcome="error",
+                reasoning=f"Could not load vanpool: {vanpool_context['error']}",
+                hitl_required=False,
+            )
 
-    employee_ids = [r["employee_id"] for r in vanpool_context.get("riders", [])]
+        employee_ids = [r["employee_id"] for r in vanpool_context.get("riders", [])]
 
-    # Check for empty vanpool (no riders)
-    if not employee_ids:
-        return CaseManagerResult(
-            vanpool_id=vanpool_id,
-            case_id=None,
-            outcome="error",
-            reasoning="Vanpool has no riders to verify.",
-            hitl_required=False,
-        )
+        # Check for empty vanpool (no riders)
+        if not employee_ids:
+            return CaseManagerResult(
+                vanpool_id=vanpool_id,
+                case_id=None,
+                outcome="error",
+                reasoning="Vanpool has no riders to verify.",
+                hitl_required=False,
+            )
 
-    # Preload case details if exists
-    case = get_existing_case(vanpool_id)
-    case_id = case["case_id"] if case else None
+        # Preload case details if exists
+        case = get_existing_case(vanpool_id)
+        case_id = case["case_id"] if case else None
 
-    # Get full case status with email thread info
-    case_details = None
-    if case_id:
-        case_details = get_case_status.func(case_id=case_id)
+        # Get full case status with email thread info
+        case_details = None
+        if case_id:
+            case_details = get_cached_case_status(case_id)
 
     timeout_elapsed = check_timeout(case)
 
-    vanpool_summary = {
-        "vanpool_id": vanpool_context.get("vanpool_id"),
-        "work_site": vanpool_context.get("work_site"),
-        "rider_count": vanpool_context.get("rider_count"),
-        "employee_ids": employee_ids,
-    }
+    vanpool_summary_json = _vanpool_summary_json(
+        vanpool_context.get("vanpool_id"),
+        vanpool_context.get("work_site"),
+        vanpool_context.get("rider_count"),
+        tuple(employee_ids),
+    )
 
     case_summary = None
     if case_details:
@@ -278,10 +365,10 @@ def _preload_investigation_context(vanpool_id: str) -> PreloadedContext | CaseMa
     message = f"""Investigate vanpool {vanpool_id}.
 
 ## Vanpool Summary
-{json.dumps(vanpool_summary, separators=(",", ":"), default=str)}
+{vanpool_summary_json}
 
 ## Case Summary (preloaded)
-{json.dumps(case_summary, separators=(",", ":"), default=str) if case_summary else "No existing case"}
+{orjson.dumps(case_summary, default=str).decode() if case_summary else "No existing case"}
 
 timeout_elapsed: {timeout_elapsed}
 
@@ -300,18 +387,151 @@ Run verification checks. If all pass, return verified. If any fail, use upsert_c
 # =============================================================================
 
 
-def _validate_case_manager_data(data: dict, vanpool_id: str, case_id: str | None) -> CaseManagerResult:
-    """Validate a dict as CaseManagerResult."""
+# Bound pydantic-core validators; skip the per-call lookup and wrapper of
+# model_validate (and TypeAdapter's extra Python layer)
+_validate_result = CaseManagerResult.__pydantic_validator__.validate_python
+_validate_result_json = CaseManagerResult.__pydantic_validator__.validate_json
+
+# Fields a trusted dict must carry before it can skip validation
+_REQUIRED_RESULT_FIELDS = frozenset(
+    name for name, field in CaseManagerResult.model_fields.items() if field.is_required()
+)
+
+
+def _pending(
+    vanpool_id: str, case_id: str | None, reasoning: str, hitl_required: bool = False
+) -> CaseManagerResult:
+    """Build a "pending" fallback result.
+
+    All fields are known-good values built here, so validation is skipped.
+    """
+    return CaseManagerResult.model_construct(
+        vanpool_id=vanpool_id,
+        case_id=case_id,
+        outcome="pending",
+        reasoning=reasoning,
+        outreach_summary=None,
+        hitl_required=hitl_required,
+    )
+
+
+def _validate_case_manager_data(
+    data: dict, vanpool_id: str, case_id: str | None, trusted: bool = False
+) -> CaseManagerResult:
+    """Validate a dict as CaseManagerResult.
+
+    Args:
+        data: Result dictionary from the agent
+        vanpool_id: Vanpool ID used for the fallback result
+        case_id: Case ID used for the fallback result
+        trusted: True when data comes from the agent's structured output,
+            whose schema response_format already enforces
+    """
     if "vanpool_id" not in data:
-        return CaseManagerResult(
-            vanpool_id=vanpool_id,
-            case_id=case_id,
-            outcome="pending",
-            reasoning=f"Agent returned unexpected schema: {str(data)[:300]}",
-            hitl_required=False,
+        return _pending(
+            vanpool_id, case_id, f"Agent returned unexpected schema: {str(data)[:300]}"
         )
-    
-    return CaseManagerResult.model_validate(data)
+
+    # Structured output was validated against the schema already; skip
+    # re-validation. Free-text (message content) always goes through validation.
+    if trusted and _REQUIRED_RESULT_FIELDS <= data.keys():
+        return CaseManagerResult.model_construct(**data)
+
+    return _validate_result(data)
+
+
+def _parse_result_content(
+    content: CaseManagerResult, vanpool_id: str, case_id: str | None
+) -> CaseManagerResult:
+    """Content is already a CaseManagerResult (from structured output)."""
+    return content
+
+
+def _parse_dict_content(content: dict, vanpool_id: str, case_id: str | None) -> CaseManagerResult:
+    """Content is a dict (from structured output); validate it."""
+    return _validate_case_manager_data(content, vanpool_id, case_id)
+
+
+def _list_preview(items: list, limit: int) -> str:
+    """Return str(items)[:limit] without stringifying items past the limit."""
+    text = "["
+    for index, item in enumerate(items):
+        text += (", " if index else "") + repr(item)
+        if len(text) >= limit:
+            return text[:limit]
+    return (text + "]")[:limit]
+
+
+def _parse_list_content(content: list, vanpool_id: str, case_id: str | None) -> CaseManagerResult:
+    """Content is a multi-part message; use the first result dict or text part."""
+    for item in content:
+        if isinstance(item, dict):
+            if "vanpool_id" in item:
+                return _validate_case_manager_data(item, vanpool_id, case_id)
+            # Check for text content blocks
+            if item.get("type") == "text" and item.get("text"):
+                return _parse_text_content(item["text"], vanpool_id, case_id)
+        elif isinstance(item, str):
+            return _parse_text_content(item, vanpool_id, case_id)
+
+    # Couldn't find usable content in list
+    return _pending(
+        vanpool_id,
+        case_id,
+        f"Agent returned list with no parseable content: {_list_preview(content, 300)}",
+    )
+
+
+def _parse_text_content(content: str, vanpool_id: str, case_id: str | None) -> CaseManagerResult:
+    """Content is text; parse it as JSON (from response_format)."""
+    if not content:
+        return _pending(vanpool_id, case_id, "Agent returned empty response")
+
+    # Well-formed results parse and validate in one pydantic-core pass; anything
+    # else falls through to the dict-based path for the more specific messages.
+    try:
+        return _validate_result_json(content)
+    except ValueError:
+        pass
+
+    try:
+        data = orjson.loads(content)
+        if isinstance(data, dict):
+            return _validate_case_manager_data(data, vanpool_id, case_id)
+        # JSON parsed but not a dict
+        return _pending(vanpool_id, case_id, f"Agent returned non-dict JSON: {content[:300]}")
+    except (ValueError, TypeError):  # orjson.JSONDecodeError and ValidationError are ValueErrors
+        pass
+
+    # Last resort - return with content as reasoning
+    return _pending(vanpool_id, case_id, f"Could not parse agent response: {content[:300]}")
+
+
+def _parse_other_content(content: Any, vanpool_id: str, case_id: str | None) -> CaseManagerResult:
+    """Content of any other type (subclasses, other Pydantic models, etc.)."""
+    if isinstance(content, CaseManagerResult):
+        return content
+
+    # If content is a Pydantic model, convert to dict first
+    if hasattr(content, "model_dump"):
+        content = content.model_dump()
+
+    if isinstance(content, dict):
+        return _parse_dict_content(content, vanpool_id, case_id)
+    if isinstance(content, list):
+        return _parse_list_content(content, vanpool_id, case_id)
+    if not content:
+        return _pending(vanpool_id, case_id, "Agent returned empty response")
+    return _parse_text_content(str(content), vanpool_id, case_id)
+
+
+# Message content parsers by exact type; anything else goes to _parse_other_content
+_CONTENT_PARSERS = {
+    CaseManagerResult: _parse_result_content,
+    dict: _parse_dict_content,
+    list: _parse_list_content,
+    str: _parse_text_content,
+}
 
 
 def parse_case_manager_result(result: dict, vanpool_id: str, case_id: str | None) -> CaseManagerResult:
@@ -322,113 +542,36 @@ def parse_case_manager_result(result: dict, vanpool_id: str, case_id: str | None
     """
     # Check for HITL interrupt - agent is paused waiting for human approval
     if "__interrupt__" in result:
-        return CaseManagerResult(
-            vanpool_id=vanpool_id,
-            case_id=case_id,
-            outcome="pending",
-            reasoning="Membership cancellation initiated. Awaiting human-in-the-loop approval.",
+        return _pending(
+            vanpool_id,
+            case_id,
+            "Membership cancellation initiated. Awaiting human-in-the-loop approval.",
             hitl_required=True,
         )
     
-    # Check if structured_response is directly available (some agent implementations)
-    if "structured_response" in result and isinstance(result["structured_response"], CaseManagerResult):
-        return result["structured_response"]
-    
+    # Happy path: response_format=CaseManagerResult places the typed result here
+    structured = result.get("structured_response")
+    if isinstance(structured, CaseManagerResult):
+        return structured
+    if isinstance(structured, dict) and "vanpool_id" in structured:
+        return _validate_case_manager_data(structured, vanpool_id, case_id, trusted=True)
+
     # Check for 'output' key (common in some agent implementations)
-    if "output" in result:
-        output = result["output"]
-        if isinstance(output, CaseManagerResult):
-            return output
-        if isinstance(output, dict) and "vanpool_id" in output:
-            return _validate_case_manager_data(output, vanpool_id, case_id)
+    output = result.get("output")
+    if isinstance(output, CaseManagerResult):
+        return output
+    if isinstance(output, dict) and "vanpool_id" in output:
+        return _validate_case_manager_data(output, vanpool_id, case_id)
     
     final_message = result.get("messages", [])[-1] if result.get("messages") else None
 
     if final_message is None:
-        return CaseManagerResult(
-            vanpool_id=vanpool_id,
-            case_id=case_id,
-            outcome="pending",
-            reasoning="Agent returned no messages",
-            hitl_required=False,
-        )
+        return _pending(vanpool_id, case_id, "Agent returned no messages")
 
     content = final_message.content if hasattr(final_message, "content") else str(final_message)
 
-    # If already a CaseManagerResult (from structured output), return directly
-    if isinstance(content, CaseManagerResult):
-        return content
-
-    # If content is a Pydantic model, convert to dict first
-    if hasattr(content, "model_dump"):
-        content = content.model_dump()
-
-    # If already a dict (from structured output), try to validate
-    if isinstance(content, dict):
-        return _validate_case_manager_data(content, vanpool_id, case_id)
-
-    # Handle list content (multi-part messages)
-    if isinstance(content, list):
-        # Try to find a dict or string in the list
-        for item in content:
-            if isinstance(item, dict):
-                if "vanpool_id" in item:
-                    return _validate_case_manager_data(item, vanpool_id, case_id)
-                # Check for text content blocks
-                if item.get("type") == "text" and item.get("text"):
-                    content = item["text"]
-                    break
-            elif isinstance(item, str):
-                content = item
-                break
-        else:
-            # Couldn't find usable content in list
-            return CaseManagerResult(
-                vanpool_id=vanpool_id,
-                case_id=case_id,
-                outcome="pending",
-                reasoning=f"Agent returned list with no parseable content: {str(content)[:300]}",
-                hitl_required=False,
-            )
-
-    # Handle empty content
-    if not content:
-        return CaseManagerResult(
-            vanpool_id=vanpool_id,
-            case_id=case_id,
-            outcome="pending",
-            reasoning="Agent returned empty response",
-            hitl_required=False,
-        )
-
-    # Ensure content is a string for JSON parsing
-    if not isinstance(content, str):
-        content = str(content)
-
-    # Try parsing as JSON (from response_format)
-    try:
-        data = json.loads(content)
-        if isinstance(data, dict):
-            return _validate_case_manager_data(data, vanpool_id, case_id)
-        # JSON parsed but not a dict
-        return CaseManagerResult(
-            vanpool_id=vanpool_id,
-            case_id=case_id,
-            outcome="pending",
-            reasoning=f"Agent returned non-dict JSON: {content[:300]}",
-            hitl_required=False,
-        )
-    except (json.JSONDecodeError, ValueError, TypeError):
-        pass
-
-    # Last resort - return with content as reasoning
-    return CaseManagerResult(
-        vanpool_id=vanpool_id,
-        case_id=case_id,
-        outcome="pending",
-        reasoning=f"Could not parse agent response: {content[:300]}",
-        hitl_required=False,
-    )
+    parse = _CONTENT_PARSERS.get(type(content), _parse_other_content)
+    return parse(content, vanpool_id, case_id)
 
 
 # =============================================================================
@@ -461,11 +604,13 @@ async def investigate_vanpool(request: CaseManagerRequest) -> CaseManagerResult:
         return ctx
 
     # Run the agent
-    agent = create_case_manager_agent()
+    agent = _get_agent()
+    config = _build_config(ctx.vanpool_id, ctx.case_id)
     result = await agent.ainvoke(
         {"messages": [HumanMessage(content=ctx.message)]},
-        config=_build_config(ctx.vanpool_id, ctx.case_id),
+        config=config,
     )
+    await arelease_thread(agent, config, result)
 
     return parse_case_manager_result(result, ctx.vanpool_id, ctx.case_id)
 
@@ -483,11 +628,13 @@ def investigate_vanpool_sync(request: CaseManagerRequest) -> CaseManagerResult:
         return ctx
 
     # Run the agent
-    agent = create_case_manager_agent()
+    agent = _get_agent()
+    config = _build_config(ctx.vanpool_id, ctx.case_id)
     result = agent.invoke(
         {"messages": [HumanMessage(content=ctx.message)]},
-        config=_build_config(ctx.vanpool_id, ctx.case_id),
+        config=config,
     )
+    release_thread(agent, config, result)
 
     return parse_case_manager_result(result, ctx.vanpool_id, ctx.case_id)
 
@@ -519,12 +666,13 @@ def investigate_vanpool_sync_with_trajectory(
             messages=[],
         )
 
-    # Run the agent
-    agent = create_case_manager_agent()
+    agent = _get_agent()
+    config = _build_config(ctx.vanpool_id, ctx.case_id)
     raw_result = agent.invoke(
         {"messages": [HumanMessage(content=ctx.message)]},
-        config=_build_config(ctx.vanpool_id, ctx.case_id),
+        config=config,
     )
+    release_thread(agent, config, raw_result)
 
     # Parse the result
     parsed_result = parse_case_manager_result(raw_result, ctx.vanpool_id, ctx.case_id)
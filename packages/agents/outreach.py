@@ -9,25 +9,33 @@ The agent uses HumanInTheLoopMiddleware to pause for human review
 when sending emails for escalation classifications.
 """
 
-import json
+import asyncio
+import logging
 import os
+import threading
 import uuid
+from collections.abc import AsyncIterator
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
-from langchain.agents import create_agent
-from langchain.agents.middleware import HumanInTheLoopMiddleware
+import orjson
 from langchain_core.messages import HumanMessage
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain_openai import ChatOpenAI
-from langgraph.checkpoint.memory import InMemorySaver
 from langsmith import traceable
 
 from agents.structures import OutreachRequest, OutreachResult
-from agents.utils import configure_langsmith
+from agents.utils import (
+    arelease_thread,
+    configure_langsmith,
+    create_checkpointer,
+    release_thread,
+)
+from core.cache import TTLCache
 from prompts.outreach_prompts import OUTREACH_AGENT_PROMPT, OUTREACH_AGENT_PROMPT_VERSION
 from tools.outreach_tools import (
-    get_email_thread,  # Used for preloading only, not as agent tool
+    THREAD_CACHE_TTL_SECONDS,
     classify_reply,
+    get_cached_email_thread,  # Used for preloading only, not as agent tool
     send_email,
     send_email_for_review,
 )
@@ -35,30 +43,48 @@ from tools.outreach_tools import (
 # Auto-configure LangSmith on import
 _langsmith_enabled = configure_langsmith()
 
+logger = logging.getLogger(__name__)
+
 
 # =============================================================================
 # Agent Configuration
 # =============================================================================
 
+# Max outreach runs in flight at once for handle_outreach_batch (OpenAI rate limits)
+OUTREACH_CONCURRENCY = int(os.environ.get("OUTREACH_CONCURRENCY", "8"))
+
 # Tools available to the agent
-# Note: get_email_thread is preloaded, not a tool
+# Note: the email thread is preloaded, not a tool
 TOOLS = [
     classify_reply,
     send_email,
     send_email_for_review,
 ]
 
-OUTPUT_PARSER = PydanticOutputParser(pydantic_object=OutreachResult)
-
-
+@lru_cache(maxsize=1)
 def get_model():
-    """Get the LLM model for the agent."""
+    """Get the LLM model for the agent (built once per process)."""
+    # Deferred so importing this module (e.g. to parse results) skips the OpenAI client
+    from langchain_openai import ChatOpenAI
+
     return ChatOpenAI(
         model=os.environ.get("OPENAI_MODEL", "gpt-4.1"),
         temperature=0,
     )
 
 
+@lru_cache(maxsize=1)
+def _get_checkpointer():
+    """Return the process-wide checkpointer shared by every Outreach agent.
+
+    Agents rebuilt outside the cached singleton (evals, trajectory runs)
+    still see checkpoints for interrupted HITL threads. The entry points
+    delete each finished run's thread (release_thread), so the saver only
+    holds runs waiting on a human.
+    """
+    return create_checkpointer()
+
+
 def create_outreach_agent():
     """Create the Outreach Agent with HITL support.
 
@@ -68,6 +94,10 @@ def create_outreach_agent():
     Returns:
         A LangGraph agent that can handle email outreach tasks.
     """
+    # Deferred: only needed when an agent is actually built
+    from langchain.agents import create_agent
+    from langchain.agents.middleware import HumanInTheLoopMiddleware
+
     model = get_model()
 
     # Create the agent with HITL middleware and enforced response schema
@@ -75,7 +105,7 @@ def create_outreach_agent():
         model=model,
         tools=TOOLS,
         system_prompt=OUTREACH_AGENT_PROMPT,
-        checkpointer=InMemorySaver(),
+        checkpointer=_get_checkpointer(),
         response_format=OutreachResult,  # Enforces deterministic JSON output
         middleware=[
             HumanInTheLoopMiddleware(
@@ -92,57 +122,98 @@ def create_outreach_agent():
     return agent
 
 
+_agent = None
+_agent_lock = threading.Lock()
+
+
+def _get_agent():
+    """Return the shared Outreach agent, creating it on first use.
+
+    The graph, model client and checkpointer are request-independent, so
+    they're built once. Runs are isolated by the thread_id in their config,
+    and sharing the checkpointer lets HITL resumes find their thread.
+    """
+    global _agent
+    if _agent is None:
+        with _agent_lock:
+            if _agent is None:
+                _agent = create_outreach_agent()
+    return _agent
+
+
 # =============================================================================
 # Result Parsing
 # =============================================================================
 
 
-def parse_outreach_result(content: str | dict) -> OutreachResult:
+# Bound pydantic-core validators; skip the per-call lookup and wrapper of model_validate
+_validate_result = OutreachResult.__pydantic_validator__.validate_python
+_validate_result_json = OutreachResult.__pydantic_validator__.validate_json
+
+# Safe default when the agent's output can't be read: escalate for human review
+_ESCALATION_DEFAULT = OutreachResult(
+    email_thread_id="unknown",
+    bucket="escalation",
+    hitl_required=True,
+    sent=False,
+)
+
+
+def parse_outreach_result(
+    content: str | dict | OutreachResult,
+    email_thread_id: str = "unknown",
+) -> OutreachResult:
     """Parse the agent's response into a structured result.
     
-    With response_format, the content may already be a dict or valid JSON.
-    Falls back gracefully if the agent returns wrong schema.
+    With response_format, the content may already be an OutreachResult,
+    a dict or valid JSON. Falls back gracefully if the agent returns wrong schema.
+
+    Args:
+        content: The agent's structured response or final message content
+        email_thread_id: Thread the run was for, stamped on the fallback result
     """
+    # Already validated by response_format - nothing to parse
+    if isinstance(content, OutreachResult):
+        return content
+
     # If already a dict (from structured output), try to validate
     if isinstance(content, dict):
         # Check if it looks like OutreachResult fields
         if "email_thread_id" in content:
-            return OutreachResult.model_validate(content)
+            return _validate_result(content)
         # Agent returned wrong schema (VerificationResult) - create default
-        return OutreachResult(
-            email_thread_id="unknown",
-            bucket="escalation",
-            hitl_required=True,
-            sent=False,
-        )
+        return _ESCALATION_DEFAULT.model_copy(update={"email_thread_id": email_thread_id})
     
-    # Try parsing as JSON first (from response_format)
+    # response_format emits the schema's JSON; parse and validate in one pass
     try:
-        import json
-        data = json.loads(content)
-        if "email_thread_id" in data:
-            return OutreachResult.model_validate(data)
-        # Wrong schema in JSON
-        return OutreachResult(
-            email_thread_id="unknown",
-            bucket="escalation", 
-            hitl_required=True,
-            sent=False,
-        )
-    except (json.JSONDecodeError, ValueError):
-        pass
-    
-    # Fallback to PydanticOutputParser for text format
-    try:
-        return OUTPUT_PARSER.parse(content)
-    except Exception:
-        # Last resort - return safe default
-        return OutreachResult(
-            email_thread_id="unknown",
-            bucket="escalation",
-            hitl_required=True,
-            sent=False,
-        )
+        return _validate_result_json(content)
+    except ValueError:
+        # Wrong schema or not JSON - return safe default
+        return _ESCALATION_DEFAULT.model_copy(update={"email_thread_id": email_thread_id})
+
+
+def _outreach_result_from_run(result: dict, email_thread_id: str) -> OutreachResult:
+    """Extract the OutreachResult from an agent run.
+
+    response_format=OutreachResult puts the validated result in
+    structured_response; otherwise parse the final message.
+    """
+    structured = result.get("structured_response")
+    if structured is not None:
+        return parse_outreach_result(structured, email_thread_id)
+
+    final_message = result["messages"][-1]
+    content = final_message.content if hasattr(final_message, "content") else str(final_message)
+
+    return parse_outreach_result(content, email_thread_id)
+
+
+# Trace metadata shared by every run; the model name is read once, like get_model()
+_TRACE_METADATA = MappingProxyType({
+    "agent": "outreach_agent",
+    "prompt_version": OUTREACH_AGENT_PROMPT_VERSION,
+    "model": os.environ.get("OPENAI_MODEL", "gpt-4.1-mini"),
+})
 
 
 def _build_config(email_thread_id: str) -> dict[str, Any]:
@@ -153,20 +224,13 @@ def _build_config(email_thread_id: str) -> dict[str, Any]:
     
     The run_name and tags are set on the @traceable decorator for the entry points.
     """
-    model_name = os.environ.get("OPENAI_MODEL", "gpt-4.1-mini")
-    
     return {
         # Thread config required for checkpointer persistence (LangGraph concept)
         "configurable": {
             "thread_id": f"outreach-{email_thread_id}-{uuid.uuid4()}",
         },
         # LangSmith trace metadata (run_name and tags are on @traceable decorator)
-        "metadata": {
-            "agent": "outreach_agent",
-            "email_thread_id": email_thread_id,
-            "prompt_version": OUTREACH_AGENT_PROMPT_VERSION,
-            "model": model_name,
-        },
+        "metadata": {**_TRACE_METADATA, "email_thread_id": email_thread_id},
     }
 
 
@@ -181,14 +245,153 @@ def _preload_thread_data(thread_id: str) -> dict | None:
     Returns:
         Thread data dict or None if not found
     """
-    # Call the underlying function (not the tool wrapper)
-    return get_email_thread.func(thread_id=thread_id)
+    return get_cached_email_thread(thread_id)
+
+
+def _thread_unusable(thread_data: dict | None) -> bool:
+    """True if the preloaded thread is missing, so the agent must not run."""
+    return thread_data is None or "error" in thread_data
+
+
+# Result for a missing thread; nothing is classified or sent
+_NOT_FOUND_DEFAULT = OutreachResult(
+    email_thread_id="unknown",
+    bucket=None,
+    hitl_required=False,
+    sent=False,
+)
+
+
+def _thread_not_found(email_thread_id: str) -> OutreachResult:
+    """Build the no-op result for a thread that couldn't be preloaded."""
+    logger.info("Outreach skipped: email thread %s not found", email_thread_id)
+    return _NOT_FOUND_DEFAULT.model_copy(update={"email_thread_id": email_thread_id})
+
+
+async def _load_thread_and_agent(email_thread_id: str) -> tuple[dict | None, Any]:
+    """Preload the thread off the event loop and fetch the shared agent.
+
+    Once the agent exists the thread is loaded alone; only the first build
+    is overlapped with it.
+    """
+    if _agent is not None:
+        thread_data = await asyncio.to_thread(_preload_thread_data, email_thread_id)
+        agent = _agent
+    else:
+        thread_data, agent = await asyncio.gather(
+            asyncio.to_thread(_preload_thread_data, email_thread_id),
+            asyncio.to_thread(_get_agent),
+        )
+    return thread_data, agent
+
+
+# Prompt budget for the preloaded thread, in tokens
+THREAD_TOKEN_BUDGET = 18_000
+# Bodies of messages other than the one being replied to are trimmed to this length
+MAX_BODY_CHARS = 2_000
+
+# Message fields the agent needs; everything else is dropped from the prompt
+_MESSAGE_FIELDS = ("message_id", "from", "to", "sent_at", "direction", "classification")
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """Return the tiktoken encoding for the configured model, loaded once.
+
+    The first load downloads the encoding files. Returns None if that fails
+    (e.g. offline), in which case counts fall back to an estimate.
+    """
+    try:
+        import tiktoken
+
+        try:
+            return tiktoken.encoding_for_model(os.environ.get("OPENAI_MODEL", "gpt-4.1"))
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+
+def _count_tokens(text: str) -> int:
+    """Count tokens in text, estimating ~4 characters per token without tiktoken."""
+    encoding = _get_encoding()
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def _summarize_thread(thread_data: dict, max_tokens: int = THREAD_TOKEN_BUDGET) -> dict:
+    """Reduce preloaded thread data to what the agent needs, within a size budget.
+
+    Messages keep only their essential fields. The latest inbound message
+    (the one being replied to) keeps its full body; other bodies are trimmed
+    to MAX_BODY_CHARS. If the thread is still over budget, the oldest
+    messages are dropped and counted in "omitted_messages".
+
+    Args:
+        thread_data: Thread dict from get_email_thread
+        max_tokens: Token budget for the serialized thread
+
+    Returns:
+        Compact thread dict for the agent prompt
+    """
+    messages = thread_data.get("messages") or []
+    reply_to = next(
+        (i for i in range(len(messages) - 1, -1, -1)
+         if messages[i].get("direction") == "inbound"),
+        None,
+    )
+
+    compact = []
+    for i, message in enumerate(messages):
+        entry = {field: message.get(field) for field in _MESSAGE_FIELDS}
+        body = message.get("body") or ""
+        if i != reply_to and len(body) > MAX_BODY_CHARS:
+            body = body[:MAX_BODY_CHARS] + "... [trimmed]"
+        entry["body"] = body
+        compact.append(entry)
+
+    summary = {key: value for key, value in thread_data.items() if key != "messages"}
+
+    # Drop the oldest messages until the rest fit, never the one being replied to
+    budget = max_tokens - _count_tokens(orjson.dumps(summary, default=str).decode())
+    sizes = [_count_tokens(orjson.dumps(entry, default=str).decode()) for entry in compact]
+    total = sum(sizes)
+    start = 0
+    last_droppable = len(compact) - 1 if reply_to is None else reply_to
+    while total > budget and start < last_droppable:
+        total -= sizes[start]
+        start += 1
+
+    if start:
+        summary["omitted_messages"] = start
+    summary["messages"] = compact[start:]
+    return summary
+
+
+# Serialized thread summaries, paired with the cached thread dict they came from
+_thread_json_cache = TTLCache(maxsize=256, ttl=THREAD_CACHE_TTL_SECONDS)
+
+
+def _thread_json(thread_data: dict) -> str:
+    """Return the compact JSON summary of thread_data, reusing it for the same dict.
+
+    get_cached_email_thread hands out the same dict until the thread changes,
+    so an identity match means the stored JSON is still current.
+    """
+    key = ("thread_json", thread_data.get("thread_id"))
+    entry = _thread_json_cache.get(key)
+    if entry is not None and entry[0] is thread_data:
+        return entry[1]
+    thread_json = orjson.dumps(_summarize_thread(thread_data), default=str).decode()
+    _thread_json_cache.set(key, (thread_data, thread_json))
+    return thread_json
 
 
 def _build_message(request: OutreachRequest, thread_data: dict) -> str:
     """Build the input message for the agent with preloaded thread data."""
-    # Compact JSON for token efficiency
-    thread_json = json.dumps(thread_data, separators=(",", ":"), default=str)
+    # Compact JSON of the essential thread fields for token efficiency
+    thread_json = _thread_json(thread_data)
     
     message = f"""Handle outreach for email thread {request.email_thread_id}.
 
@@ -220,30 +423,20 @@ async def handle_outreach(request: OutreachRequest) -> OutreachResult:
     Returns:
         OutreachResult with email_thread_id, message_id, bucket, hitl_required, sent
     """
-    # Preload thread data
-    thread_data = _preload_thread_data(request.email_thread_id)
-    
-    if thread_data is None or "error" in thread_data:
-        return OutreachResult(
-            email_thread_id=request.email_thread_id,
-            bucket=None,
-            hitl_required=False,
-            sent=False,
-        )
+    thread_data, agent = await _load_thread_and_agent(request.email_thread_id)
     
-    agent = create_outreach_agent()
+    if _thread_unusable(thread_data):
+        return _thread_not_found(request.email_thread_id)
 
     # Run the agent with preloaded data
+    config = _build_config(request.email_thread_id)
     result = await agent.ainvoke(
         {"messages": [HumanMessage(content=_build_message(request, thread_data))]},
-        config=_build_config(request.email_thread_id),
+        config=config,
     )
+    await arelease_thread(agent, config, result)
 
-    # Parse the final message into structured result
-    final_message = result["messages"][-1]
-    content = final_message.content if hasattr(final_message, "content") else str(final_message)
-
-    return parse_outreach_result(content)
+    return _outreach_result_from_run(result, request.email_thread_id)
 
 
 @traceable(
@@ -256,24 +449,85 @@ def handle_outreach_sync(request: OutreachRequest) -> OutreachResult:
     # Preload thread data
     thread_data = _preload_thread_data(request.email_thread_id)
     
-    if thread_data is None or "error" in thread_data:
-        return OutreachResult(
-            email_thread_id=request.email_thread_id,
-            bucket=None,
-            hitl_required=False,
-            sent=False,
-        )
+    if _thread_unusable(thread_data):
+        return _thread_not_found(request.email_thread_id)
     
-    agent = create_outreach_agent()
+    agent = _get_agent()
 
     # Run the agent with preloaded data
+    config = _build_config(request.email_thread_id)
     result = agent.invoke(
         {"messages": [HumanMessage(content=_build_message(request, thread_data))]},
-        config=_build_config(request.email_thread_id),
+        config=config,
     )
+    release_thread(agent, config, result)
 
-    # Parse the final message into structured result
-    final_message = result["messages"][-1]
-    content = final_message.content if hasattr(final_message, "content") else str(final_message)
+    return _outreach_result_from_run(result, request.email_thread_id)
+
+
+async def handle_outreach_stream(
+    request: OutreachRequest,
+) -> AsyncIterator[str | OutreachResult]:
+    """Streaming version of handle_outreach for interactive callers.
+
+    Yields the agent's text tokens as they are generated, then the final
+    OutreachResult as the last item.
+
+    Args:
+        request: OutreachRequest with email_thread_id and optional context
+
+    Yields:
+        Text chunks from the agent's model calls, then the OutreachResult
+    """
+    thread_data, agent = await _load_thread_and_agent(request.email_thread_id)
+
+    if _thread_unusable(thread_data):
+        yield _thread_not_found(request.email_thread_id)
+        return
+
+    config = _build_config(request.email_thread_id)
+    final_state: dict = {}
+    async for mode, chunk in agent.astream(
+        {"messages": [HumanMessage(content=_build_message(request, thread_data))]},
+        config=config,
+        stream_mode=["messages", "values"],
+    ):
+        if mode == "values":
+            final_state = chunk
+            continue
+        message, metadata = chunk
+        # Skip tokens from models called inside tools (e.g. classify_reply)
+        content = message.content
+        if metadata.get("langgraph_node") == "model" and content and isinstance(content, str):
+            yield content
+
+    # An interrupt shows up as "__interrupt__" in the last values chunk
+    await arelease_thread(agent, config, final_state)
+
+    yield _outreach_result_from_run(final_state, request.email_thread_id)
+
+
+async def handle_outreach_batch(
+    requests: list[OutreachRequest],
+    max_concurrency: int = OUTREACH_CONCURRENCY,
+) -> list[OutreachResult | BaseException]:
+    """Run handle_outreach for several threads concurrently.
+
+    At most max_concurrency runs are in flight at once, to stay within
+    OpenAI rate limits.
+
+    Args:
+        requests: Outreach requests to handle
+        max_concurrency: Maximum number of concurrent agent runs
+
+    Returns:
+        Results in request order; a failed run yields its exception instead
+        of cancelling the rest of the batch
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(request: OutreachRequest) -> OutreachResult:
+        async with semaphore:
+            return await handle_outreach(request)
 
-    return parse_outreach_result(content)
+    return await asyncio.gather(*(run_one(r) for r in requests), return_exceptions=True)
@@ -11,16 +11,18 @@ The agent:
 5. Returns a structured verdict with evidence
 """
 
+import asyncio
 import os
+import threading
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from langchain_core.messages import HumanMessage
 from langchain_core.output_parsers import PydanticOutputParser
-from langchain_openai import ChatOpenAI
-from langgraph.prebuilt import create_react_agent
 
 from agents.structures import ShiftVerificationResult
-from agents.utils import parse_legacy_verification_result
+from agents.utils import configure_langsmith, parse_legacy_verification_result
 from prompts.shift_specialist_prompts import SHIFT_SPECIALIST_PROMPT, SHIFT_SPECIALIST_PROMPT_VERSION
 from tools.shift_specialist_tools import get_employee_shifts
 
@@ -29,14 +31,6 @@ from tools.shift_specialist_tools import get_employee_shifts
 # LangSmith Tracing Configuration
 # =============================================================================
 
-def configure_langsmith():
-    if os.environ.get("LANGSMITH_API_KEY"):
-        os.environ.setdefault("LANGSMITH_TRACING", "true")
-        os.environ.setdefault("LANGSMITH_PROJECT", "pool-patrol")
-        return True
-    return False
-
-
 # Auto-configure on import
 _langsmith_enabled = configure_langsmith()
 
@@ -45,13 +39,23 @@ _langsmith_enabled = configure_langsmith()
 # Agent Configuration
 # =============================================================================
 
+# Max verifications in flight at once for verify_employee_shifts_batch (OpenAI rate limits)
+SHIFT_VERIFICATION_CONCURRENCY = int(os.environ.get("SHIFT_VERIFICATION_CONCURRENCY", "8"))
+
 # Tools available to the agent
 TOOLS = [get_employee_shifts]
 OUTPUT_PARSER = PydanticOutputParser(pydantic_object=ShiftVerificationResult)
 
+# System prompt with structured output instructions, built once at import
+STRUCTURED_PROMPT = SHIFT_SPECIALIST_PROMPT + "\n\n" + OUTPUT_PARSER.get_format_instructions()
+
 
+@lru_cache(maxsize=1)
 def get_model():
-    """Get the LLM model for the agent."""
+    """Get the LLM model for the agent (built once per process)."""
+    # Deferred so importing this module (e.g. to parse results) skips the OpenAI client
+    from langchain_openai import ChatOpenAI
+
     return ChatOpenAI(
         model=os.environ.get("OPENAI_MODEL", "gpt-4.1-mini"),
         temperature=0,
@@ -64,25 +68,39 @@ def create_shift_specialist():
     This creates a ReAct-style agent that can use tools to gather information
     and reason about shift compatibility.
     """
+    # Deferred: only needed when an agent is actually built
+    from langgraph.prebuilt import create_react_agent
+
     model = get_model()
-    
-    # Inject structured output instructions into the prompt
-    structured_prompt = (
-        SHIFT_SPECIALIST_PROMPT
-        + "\n\n"
-        + OUTPUT_PARSER.get_format_instructions()
-    )
 
     # Create the agent with tools and system prompt
     agent = create_react_agent(
         model=model,
         tools=TOOLS,
-        prompt=structured_prompt,
+        prompt=STRUCTURED_PROMPT,
     )
     
     return agent
 
 
+_agent = None
+_agent_lock = threading.Lock()
+
+
+def _get_agent():
+    """Return the shared Shift Specialist agent, creating it on first use.
+
+    The agent holds no per-run state (no checkpointer), so one instance
+    serves every verification.
+    """
+    global _agent
+    if _agent is None:
+        with _agent_lock:
+            if _agent is None:
+                _agent = create_shift_specialist()
+    return _agent
+
+
 # =============================================================================
 # Result Parsing
 # =============================================================================
@@ -96,18 +114,24 @@ def parse_verification_result(content: str) -> ShiftVerificationResult:
         return parse_legacy_verification_result(content, ShiftVerificationResult)
 
 
+# Trace metadata shared by every run; the model name is read once, like get_model()
+_TRACE_METADATA = MappingProxyType({
+    "agent": "shift_specialist",
+    "prompt_version": SHIFT_SPECIALIST_PROMPT_VERSION,
+    "model": os.environ.get("OPENAI_MODEL", "gpt-4.1-mini"),
+})
+_TRACE_TAGS = ("agent:shift_specialist", "component:verification")
+
+
 def _build_trace_config(employee_ids: list[str]) -> dict[str, Any]:
     """Build LangSmith trace metadata and tags for this run."""
-    model_name = os.environ.get("OPENAI_MODEL", "gpt-4.1-mini")
     return {
         "run_name": "shift_specialist",
-        "tags": ["agent:shift_specialist", "component:verification"],
+        "tags": list(_TRACE_TAGS),
         "metadata": {
-            "agent": "shift_specialist",
+            **_TRACE_METADATA,
             "employee_ids": employee_ids,
             "employee_count": len(employee_ids),
-            "prompt_version": SHIFT_SPECIALIST_PROMPT_VERSION,
-            "model": model_name,
         },
     }
 
@@ -130,15 +154,14 @@ async def verify_employee_shifts(employee_ids: list[str]) -> ShiftVerificationRe
     """
     # Handle empty list edge case
     if not employee_ids:
-        return ShiftVerificationResult(
+        return ShiftVerificationResult.model_construct(
             verdict="fail",
             confidence=5,
             reasoning="No employees provided. Cannot verify shift compatibility with an empty list.",
             evidence=[],
         )
     
-    # Create the agent
-    agent = create_shift_specialist()
+    agent = _get_agent()
     
     # Build the message for the agent
     employee_list = ", ".join(employee_ids)
@@ -161,15 +184,14 @@ def verify_employee_shifts_sync(employee_ids: list[str]) -> ShiftVerificationRes
     """Synchronous version of verify_employee_shifts."""
     # Handle empty list edge case
     if not employee_ids:
-        return ShiftVerificationResult(
+        return ShiftVerificationResult.model_construct(
             verdict="fail",
             confidence=5,
             reasoning="No employees provided. Cannot verify shift compatibility with an empty list.",
             evidence=[],
         )
     
-    # Create the agent
-    agent = create_shift_specialist()
+    agent = _get_agent()
     
     # Build the message for the agent
     employee_list = ", ".join(employee_ids)
@@ -188,6 +210,32 @@ def verify_employee_shifts_sync(employee_ids: list[str]) -> ShiftVerificationRes
     return parse_verification_result(content)
 
 
+async def verify_employee_shifts_batch(
+    employee_groups: list[list[str]],
+    max_concurrency: int = SHIFT_VERIFICATION_CONCURRENCY,
+) -> list[ShiftVerificationResult | BaseException]:
+    """Verify shift compatibility for several employee groups concurrently.
+
+    At most max_concurrency verifications are in flight at once, to stay
+    within OpenAI rate limits.
+
+    Args:
+        employee_groups: Employee ID lists, one per verification
+        max_concurrency: Maximum number of concurrent agent runs
+
+    Returns:
+        Results in input order; a failed run yields its exception instead
+        of cancelling the rest of the batch
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(employee_ids: list[str]) -> ShiftVerificationResult:
+        async with semaphore:
+            return await verify_employee_shifts(employee_ids)
+
+    return await asyncio.gather(*(run_one(g) for g in employee_groups), return_exceptions=True)
+
+
 # For backward compatibility
 def compile_shift_specialist():
     """Compile the Shift Specialist agent (for backward compatibility)."""
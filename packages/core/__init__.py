@@ -1,49 +1,78 @@
-"""Pool Patrol Core - Shared models, config, and utilities."""
+"""Pool Patrol Core - Shared models, config, and utilities.
 
-# Pydantic models (for API request/response validation)
-from .models import (
-    Case,
-    CaseMetadata,
-    CaseStatus,
-    Classification,
-    ClassificationBucket,
-    Coordinates,
-    DaySchedule,
-    EmailThread,
-    Employee,
-    EmployeeStatus,
-    Message,
-    MessageDirection,
-    MessageStatus,
-    Rider,
-    Shift,
-    Shifts,
-    ThreadStatus,
-    TimeType,
-    Vanpool,
-    VanpoolStatus,
-)
+Exports are loaded lazily (PEP 562), so importing a single submodule such
+as core.cache doesn't pull in Pydantic schemas or SQLAlchemy models.
+"""
 
-# Database utilities
-from .database import (
-    get_session,
-    get_engine,
-    init_db,
-    reset_engine,
-    Base,
-)
+import importlib
+
+# Export name -> (submodule, attribute)
+_LAZY = {
+    # Pydantic models (for API request/response validation)
+    **{
+        name: (".models", name)
+        for name in (
+            "Case",
+            "CaseMetadata",
+            "CaseStatus",
+            "Classification",
+            "ClassificationBucket",
+            "Coordinates",
+            "DaySchedule",
+            "EmailThread",
+            "Employee",
+            "EmployeeStatus",
+            "Message",
+            "MessageDirection",
+            "MessageStatus",
+            "Rider",
+            "Shift",
+            "Shifts",
+            "ThreadStatus",
+            "TimeType",
+            "Vanpool",
+            "VanpoolStatus",
+        )
+    },
+    # Database utilities
+    **{
+        name: (".database", name)
+        for name in (
+            "get_session",
+            "session_scope",
+            "get_async_session",
+            "get_engine",
+            "get_async_engine",
+            "init_db",
+            "reset_engine",
+            "Base",
+        )
+    },
+    # SQLAlchemy models (for database queries)
+    # Exported with DB prefix to distinguish from Pydantic models
+    "DBShift": (".db_models", "Shift"),
+    "DBVanpool": (".db_models", "Vanpool"),
+    "DBEmployee": (".db_models", "Employee"),
+    "DBRider": (".db_models", "Rider"),
+    "DBCase": (".db_models", "Case"),
+    "DBEmailThread": (".db_models", "EmailThread"),
+    "DBMessage": (".db_models", "Message"),
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
 
-# SQLAlchemy models (for database queries)
-# Import with DB prefix to distinguish from Pydantic models
-from .db_models import (
-    Shift as DBShift,
-    Vanpool as DBVanpool,
-    Employee as DBEmployee,
-    Rider as DBRider,
-    Case as DBCase,
-    EmailThread as DBEmailThread,
-    Message as DBMessage,
-)
 
 __all__ = [
     # Enums
@@ -70,7 +99,10 @@ __all__ = [
     "EmailThread",
     # Database utilities
     "get_session",
+    "session_scope",
+    "get_async_session",
     "get_engine",
+    "get_async_engine",
     "init_db",
     "reset_engine",
     "Base",
@@ -0,0 +1,76 @@
+"""Small in-process TTL cache for Pool Patrol.
+
+Bounded, thread-safe LRU cache whose entries expire after a fixed TTL.
+Keys are tuples whose first element is a namespace, so related entries
+can be dropped together after a mutation.
+
+Usage:
+    from core.cache import TTLCache
+
+    cache = TTLCache(maxsize=256, ttl=10)
+    cache.set(("cases", status, vanpool_id), payload)
+    payload = cache.get(("cases", status, vanpool_id))
+
+    # After a write that affects cases
+    cache.clear("cases")
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU cache with per-entry expiry."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 10.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing/expired."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Drop a single entry if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self, namespace: str | None = None) -> None:
+        """Drop all entries, or only those whose key starts with namespace."""
+        with self._lock:
+            if namespace is None:
+                self._data.clear()
+                return
+            stale = [
+                key for key in self._data
+                if isinstance(key, tuple) and key and key[0] == namespace
+            ]
+            for key in stale:
+                del self._data[key]
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -12,14 +12,25 @@ Usage:
     # Use session for queries
     with get_session() as session:
         employees = session.query(Employee).all()
+
+    # Share one session across several get_session() calls (e.g. one case's preload)
+    with session_scope():
+        ...
+
+    # Use an async session from async code (e.g. FastAPI routes)
+    async with get_async_session() as session:
+        result = await session.execute(select(Employee))
 """
 
 import os
-from contextlib import contextmanager
+import threading
+from collections.abc import AsyncGenerator, Generator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker, declarative_base
 
 # Base class for SQLAlchemy models
@@ -50,9 +61,74 @@ def get_database_url() -> str:
     return url
 
 
+def get_async_database_url() -> str:
+    """Get database URL with an asyncio driver (aiosqlite / asyncpg)."""
+    url = get_database_url()
+
+    if url.startswith("sqlite:///"):
+        return url.replace("sqlite:///", "sqlite+aiosqlite:///", 1)
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+    return url
+
+
+# Connection pool settings shared by the sync and async engines
+POOL_SIZE = 20
+MAX_OVERFLOW = 10
+POOL_RECYCLE_SECONDS = 3600
+
+
+def _pool_kwargs(database_url: str) -> dict:
+    """Pool settings for an engine URL.
+
+    In-memory SQLite uses a single-connection pool that doesn't accept
+    sizing arguments, so only file-backed and server databases get them.
+    """
+    if database_url.startswith("sqlite") and ":memory:" in database_url:
+        return {}
+    return {
+        "pool_size": POOL_SIZE,
+        "max_overflow": MAX_OVERFLOW,
+        "pool_recycle": POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": True,
+    }
+
+
+# Per-connection SQLite settings: WAL lets readers run alongside a writer,
+# NORMAL sync is safe under WAL, and a 64 MiB page cache keeps hot tables in memory
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Apply SQLITE_PRAGMAS to each new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _configure_sqlite(engine, database_url: str) -> None:
+    """Register the SQLite pragmas on a file-backed SQLite engine.
+
+    In-memory databases can't use WAL, and other backends are left untouched.
+    """
+    if database_url.startswith("sqlite") and ":memory:" not in database_url:
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+
+
 # Create engine (lazy initialization)
 _engine = None
 _SessionLocal = None
+_async_engine = None
+_AsyncSessionLocal = None
 
 
 def get_engine():
@@ -69,8 +145,10 @@ def get_engine():
         _engine = create_engine(
             database_url,
             connect_args=connect_args,
+            **_pool_kwargs(database_url),
             echo=os.environ.get("SQL_DEBUG", "").lower() == "true",
         )
+        _configure_sqlite(_engine, database_url)
     return _engine
 
 
@@ -81,19 +159,34 @@ def get_session_factory():
         _SessionLocal = sessionmaker(
             autocommit=False,
             autoflush=False,
+            expire_on_commit=False,
             bind=get_engine(),
         )
     return _SessionLocal
 
 
+# Session opened by session_scope(), with the thread that owns it
+_scoped_session: ContextVar[tuple[Session, int] | None] = ContextVar(
+    "pool_patrol_scoped_session", default=None
+)
+
+
 @contextmanager
 def get_session() -> Generator[Session, None, None]:
     """Get a database session as a context manager.
+
+    Inside session_scope() on the same thread, the scope's session is
+    reused; the scope commits and closes it.
     
     Usage:
         with get_session() as session:
             employees = session.query(Employee).all()
     """
+    scoped = _scoped_session.get()
+    if scoped is not None and scoped[1] == threading.get_ident():
+        yield scoped[0]
+        return
+
     SessionLocal = get_session_factory()
     session = SessionLocal()
     try:
@@ -106,6 +199,79 @@ def get_session() -> Generator[Session, None, None]:
         session.close()
 
 
+@contextmanager
+def session_scope() -> Generator[Session, None, None]:
+    """Share one session across all get_session() calls in this block.
+
+    Lookups in the block reuse one pooled connection and identity map. The
+    session stays bound to the calling thread: code moved to another thread
+    (e.g. asyncio.to_thread, which copies context) opens its own session.
+
+    Usage:
+        with session_scope():
+            roster = get_vanpool_roster.func(vanpool_id=vanpool_id)
+            case = get_case_status.func(case_id=case_id)
+    """
+    scoped = _scoped_session.get()
+    if scoped is not None and scoped[1] == threading.get_ident():
+        yield scoped[0]
+        return
+
+    with get_session() as session:
+        token = _scoped_session.set((session, threading.get_ident()))
+        try:
+            yield session
+        finally:
+            _scoped_session.reset(token)
+
+
+def get_async_engine():
+    """Get or create the async database engine."""
+    global _async_engine
+    if _async_engine is None:
+        database_url = get_async_database_url()
+        _async_engine = create_async_engine(
+            database_url,
+            **_pool_kwargs(database_url),
+            echo=os.environ.get("SQL_DEBUG", "").lower() == "true",
+        )
+        # Pool events are registered on the sync engine behind the async one
+        _configure_sqlite(_async_engine.sync_engine, database_url)
+    return _async_engine
+
+
+def get_async_session_factory():
+    """Get or create the async session factory."""
+    global _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        _AsyncSessionLocal = async_sessionmaker(
+            autoflush=False,
+            expire_on_commit=False,
+            bind=get_async_engine(),
+        )
+    return _AsyncSessionLocal
+
+
+@asynccontextmanager
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get an async database session as a context manager.
+
+    Usage:
+        async with get_async_session() as session:
+            result = await session.execute(select(Employee))
+    """
+    AsyncSessionLocal = get_async_session_factory()
+    session = AsyncSessionLocal()
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
 def init_db():
     """Initialize the database (create tables if they don't exist).
     
@@ -120,9 +286,14 @@ def init_db():
 
 
 def reset_engine():
-    """Reset the engine and session factory (useful for testing)."""
-    global _engine, _SessionLocal
+    """Reset the engines and session factories (useful for testing)."""
+    global _engine, _SessionLocal, _async_engine, _AsyncSessionLocal
     if _engine is not None:
         _engine.dispose()
+    if _async_engine is not None:
+        # Pooled async connections can only be closed on their event loop
+        _async_engine.sync_engine.dispose(close=False)
     _engine = None
     _SessionLocal = None
+    _async_engine = None
+    _AsyncSessionLocal = None
@@ -3,20 +3,22 @@
 These models mirror the Prisma schema and are used for Python database queries.
 The schema source of truth is prisma/schema.prisma.
 
-Note: JSON fields are stored as TEXT in SQLite and used with json.loads/dumps.
+Note: JSON fields are stored as TEXT in SQLite and used with orjson loads/dumps
+      (JSONText columns do the conversion at load/bind time).
 Note: Prisma stores DateTime as Unix milliseconds (BigInt), so we use a custom
       type decorator to convert to/from Python datetime.
 """
 
-import json
 import uuid
 from datetime import datetime
 from typing import Any, Optional
 
+import orjson
 from sqlalchemy import (
     BigInteger,
     Column,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -130,14 +132,34 @@ def parse_json(value: str | None) -> Any:
     """Parse a JSON string field."""
     if value is None:
         return None
-    return json.loads(value)
+    return orjson.loads(value)
 
 
 def to_json(value: Any) -> str | None:
     """Convert a value to JSON string."""
     if value is None:
         return None
-    return json.dumps(value)
+    # Non-string keys are stringified, as json.dumps did
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+class JSONText(TypeDecorator):
+    """SQLAlchemy type that stores JSON as TEXT and exposes Python values.
+
+    Keeps the column a plain String in the Prisma schema while deserializing
+    once when the row is loaded instead of at every call site.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        """Serialize Python value to a JSON string for storage."""
+        return to_json(value)
+
+    def process_result_value(self, value, dialect):
+        """Parse the stored JSON string into a Python value."""
+        return parse_json(value)
 
 
 # =============================================================================
@@ -188,6 +210,10 @@ class Vanpool(Base):
     created_at = Column(PrismaDateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(PrismaDateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
+    __table_args__ = (
+        Index("vanpools_status_work_site_idx", "status", "work_site"),
+    )
+
     # Relationships
     coordinator = relationship("Employee", back_populates="coordinated_vanpool", foreign_keys=[coordinator_id])
     riders = relationship("Rider", back_populates="vanpool", cascade="all, delete-orphan")
@@ -199,17 +225,37 @@ class Vanpool(Base):
         """Get work site coordinates as dict."""
         return parse_json(self.work_site_coords)
 
+    # Columns to_dict() reads; with a rider count they're all it needs
+    SUMMARY_COLUMNS = (
+        "vanpool_id",
+        "work_site",
+        "work_site_address",
+        "work_site_coords",
+        "capacity",
+        "coordinator_id",
+        "status",
+    )
+
     def to_dict(self) -> dict:
         """Convert to dictionary."""
+        return self.summary_dict(self, len(self.riders) if self.riders else 0)
+
+    @staticmethod
+    def summary_dict(row, rider_count: int) -> dict:
+        """Build the to_dict() shape from anything carrying SUMMARY_COLUMNS.
+
+        Lets column-only queries (plain rows, no ORM hydration) serialize
+        exactly like a loaded Vanpool.
+        """
         return {
-            "vanpool_id": self.vanpool_id,
-            "work_site": self.work_site,
-            "work_site_address": self.work_site_address,
-            "work_site_coords": self.coords,
-            "capacity": self.capacity,
-            "coordinator_id": self.coordinator_id,
-            "status": self.status,
-            "rider_count": len(self.riders) if self.riders else 0,
+            "vanpool_id": row.vanpool_id,
+            "work_site": row.work_site,
+            "work_site_address": row.work_site_address,
+            "work_site_coords": parse_json(row.work_site_coords),
+            "capacity": row.capacity,
+            "coordinator_id": row.coordinator_id,
+            "status": row.status,
+            "rider_count": rider_count,
         }
 
 
@@ -238,6 +284,10 @@ class Employee(Base):
     created_at = Column(PrismaDateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(PrismaDateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
+    __table_args__ = (
+        Index("employees_status_work_site_idx", "status", "work_site"),
+    )
+
     # Relationships
     shift = relationship("Shift", back_populates="employees")
     vanpool_riders = relationship("Rider", back_populates="employee", cascade="all, delete-orphan")
@@ -316,6 +366,10 @@ class Case(Base):
     vanpool = relationship("Vanpool", back_populates="cases")
     email_thread = relationship("EmailThread", back_populates="case", uselist=False)
 
+    __table_args__ = (
+        Index("cases_vanpool_id_status_idx", "vanpool_id", "status"),
+    )
+
     @property
     def case_metadata(self) -> dict:
         """Get metadata as dict."""
@@ -353,6 +407,10 @@ class EmailThread(Base):
     vanpool = relationship("Vanpool", back_populates="email_threads")
     messages = relationship("Message", back_populates="thread", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index("email_threads_vanpool_id_status_idx", "vanpool_id", "status"),
+    )
+
     def to_dict(self, include_messages: bool = False) -> dict:
         """Convert to dictionary."""
         result = {
@@ -377,7 +435,7 @@ class Message(Base):
     message_id = Column(String, unique=True, nullable=False)
     thread_id = Column(String, ForeignKey("email_threads.thread_id", ondelete="CASCADE"), nullable=False)
     from_email = Column(String, nullable=False)
-    to_emails = Column(Text, nullable=False)  # JSON array
+    to_emails = Column(JSONText, nullable=False)  # JSON array, loaded as list[str]
     sent_at = Column(PrismaDateTime, nullable=False)
     body = Column(Text, nullable=False)
     direction = Column(String, nullable=False)
@@ -388,10 +446,14 @@ class Message(Base):
     # Relationships
     thread = relationship("EmailThread", back_populates="messages")
 
+    __table_args__ = (
+        Index("messages_thread_id_status_idx", "thread_id", "status"),
+    )
+
     @property
     def to_list(self) -> list[str]:
         """Get to_emails as list."""
-        return parse_json(self.to_emails) or []
+        return self.to_emails or []
 
     @property
     def classification(self) -> Optional[dict]:
@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
 # =============================================================================
@@ -93,19 +93,34 @@ class TimeType(str, Enum):
     CONTRACT = "contract"
 
 
+# =============================================================================
+# Base Model
+# =============================================================================
+
+
+class _CoreModel(BaseModel):
+    """Base for API data models.
+
+    Instances are read-only snapshots served by the API, so they are frozen
+    (no assignment validation needed) and can be built straight from ORM rows.
+    """
+
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
+
 # =============================================================================
 # Vanpool Models
 # =============================================================================
 
 
-class Coordinates(BaseModel):
+class Coordinates(_CoreModel):
     """Geographic coordinates."""
 
     lat: float
     lng: float
 
 
-class Rider(BaseModel):
+class Rider(_CoreModel):
     """A rider in a vanpool."""
 
     participant_id: str
@@ -113,7 +128,7 @@ class Rider(BaseModel):
     email: str | None = None  # Employee email for convenience (populated from join)
 
 
-class Vanpool(BaseModel):
+class Vanpool(_CoreModel):
     """Vanpool data model."""
 
     vanpool_id: str
@@ -131,7 +146,7 @@ class Vanpool(BaseModel):
 # =============================================================================
 
 
-class DaySchedule(BaseModel):
+class DaySchedule(_CoreModel):
     """Shift schedule for a single day."""
 
     day: str  # Mon, Tue, Wed, Thu, Fri, Sat, Sun
@@ -139,7 +154,7 @@ class DaySchedule(BaseModel):
     end_time: str  # HH:MM format
 
 
-class Shift(BaseModel):
+class Shift(_CoreModel):
     """Shift template with schedule."""
 
     id: str
@@ -147,7 +162,7 @@ class Shift(BaseModel):
     schedule: list[DaySchedule]
 
 
-class Shifts(BaseModel):
+class Shifts(_CoreModel):
     """Combined shift and PTO information for an employee.
     
     This is a "view model" that combines:
@@ -160,7 +175,7 @@ class Shifts(BaseModel):
     pto_dates: list[str] = Field(default_factory=list)  # YYYY-MM-DD format
 
 
-class Employee(BaseModel):
+class Employee(_CoreModel):
     """Employee data model."""
 
     employee_id: str
@@ -185,7 +200,7 @@ class Employee(BaseModel):
 # =============================================================================
 
 
-class CaseMetadata(BaseModel):
+class CaseMetadata(_CoreModel):
     """Metadata for a flagged case."""
 
     reason: CaseReason
@@ -193,7 +208,7 @@ class CaseMetadata(BaseModel):
     additional_info: dict[str, Any] = Field(default_factory=dict)
 
 
-class Case(BaseModel):
+class Case(_CoreModel):
     """Investigation case data model."""
 
     case_id: str
@@ -212,13 +227,13 @@ class Case(BaseModel):
 # =============================================================================
 
 
-class Classification(BaseModel):
+class Classification(_CoreModel):
     """Reply classification result."""
 
     bucket: ClassificationBucket
 
 
-class Message(BaseModel):
+class Message(_CoreModel):
     """A single email message in a thread."""
 
     message_id: str
@@ -230,11 +245,10 @@ class Message(BaseModel):
     classification: Classification | None = None
     status: MessageStatus
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
-class EmailThread(BaseModel):
+class EmailThread(_CoreModel):
     """Email thread data model."""
 
     thread_id: str
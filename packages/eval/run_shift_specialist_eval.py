@@ -53,6 +53,8 @@ DATASET_NAME = "shift-specialist-eval-small"
 EXPERIMENT_PREFIX = "shift-specialist"
 
 OUTPUT_PARSER = PydanticOutputParser(pydantic_object=ShiftVerificationResult)
+# Rendered once; the schema walk is the same for every example
+FORMAT_INSTRUCTIONS = OUTPUT_PARSER.get_format_instructions()
 
 
 def get_model():
@@ -118,7 +120,7 @@ Rules:
 - A single employee always passes (no conflict possible)
 - If there are employees with different shift types, return "fail"
 
-{OUTPUT_PARSER.get_format_instructions()}"""
+{FORMAT_INSTRUCTIONS}"""
 
     model = get_model()
     response = model.invoke(prompt)
@@ -0,0 +1,38 @@
+"""Short-lived cache for case lookups.
+
+Case lookups made while preloading an investigation are reused across
+bursts (retries, HITL resumes). Any case or thread write clears the whole
+cache - both the Case Manager tools and the API routes that write cases.
+
+Kept apart from case_manager_tools so the API can invalidate it without
+importing the agents.
+"""
+
+from collections.abc import Callable
+from typing import TypeVar
+
+from core.cache import TTLCache
+
+T = TypeVar("T")
+
+CASE_CACHE_TTL_SECONDS = 5
+_case_cache = TTLCache(maxsize=1024, ttl=CASE_CACHE_TTL_SECONDS)
+_MISSING = object()
+
+
+def cached_case_lookup(key: tuple, load: Callable[[], T]) -> T:
+    """Return the cached value for key, calling load() on a miss.
+
+    None results are cached too. Cached values are shared between callers
+    and must not be mutated.
+    """
+    value = _case_cache.get(key, _MISSING)
+    if value is _MISSING:
+        value = load()
+        _case_cache.set(key, value)
+    return value
+
+
+def invalidate_case_cache() -> None:
+    """Drop cached case lookups after a case or email thread changes."""
+    _case_cache.clear()
@@ -18,6 +18,15 @@ from agents.structures import OutreachRequest
 from core.database import get_session
 from core.db_models import Case, CaseStatus, EmailThread, Rider, ThreadStatus, to_json
 from prompts.initial_outreach import render_template
+from tools.case_cache import cached_case_lookup, invalidate_case_cache
+from tools.vanpool import invalidate_vanpool_roster
+
+
+def get_cached_case_status(case_id: str) -> dict:
+    """Return get_case_status's result, cached for CASE_CACHE_TTL_SECONDS."""
+    return cached_case_lookup(
+        ("case_status", case_id), lambda: get_case_status.func(case_id=case_id)
+    )
 
 
 # =============================================================================
@@ -115,7 +124,8 @@ def upsert_case(
                 (e.g., "Shift mismatch detected: employee works night shift")
         failed_checks: Which checks failed (e.g., ["shift"], ["location"], ["shift", "location"])
         case_id: Optional - if provided, updates this case instead of creating new
-        status: Optional - new status for the case (e.g., "verification", "pending_reply", "re_audit")
+        status: Optional - new status for the case
+                (e.g., "verification", "pending_reply", "re_audit")
 
     Returns:
         A dictionary with:
@@ -153,6 +163,7 @@ def upsert_case(
                 existing_case.status = status
 
             session.commit()
+            invalidate_case_cache()
 
             return {
                 "case_id": existing_case.case_id,
@@ -182,6 +193,7 @@ def upsert_case(
                 existing_case.status = status
 
             session.commit()
+            invalidate_case_cache()
 
             return {
                 "case_id": existing_case.case_id,
@@ -210,6 +222,7 @@ def upsert_case(
         )
         session.add(new_case)
         session.commit()
+        invalidate_case_cache()
 
         return {
             "case_id": new_case_id,
@@ -305,6 +318,7 @@ def close_case(case_id: str, outcome: str, reason: str) -> dict:
         case.outcome = reason
         case.resolved_at = datetime.utcnow()
         session.commit()
+        invalidate_case_cache()
 
         return {
             "case_id": case_id,
@@ -363,6 +377,7 @@ def _create_email_thread_for_case(session, case: Case, context: str) -> EmailThr
     )
     session.add(new_thread)
     session.commit()
+    invalidate_case_cache()
     
     return new_thread
 
@@ -436,6 +451,7 @@ def run_outreach(case_id: str, context: str) -> dict:
             if case:
                 case.status = CaseStatus.HITL_REVIEW
                 session.commit()
+                invalidate_case_cache()
 
     return result.model_dump()
 
@@ -494,6 +510,7 @@ def cancel_membership(case_id: str, employee_id: str, reason: str) -> dict:
         # Remove the rider
         session.delete(rider)
         session.commit()
+        invalidate_vanpool_roster(vanpool_id)
 
         return {
             "cancelled": True,
@@ -6,16 +6,16 @@ This module provides tools for:
 - Sending emails via Resend API (with and without HITL review)
 """
 
-import json
 import os
 import uuid
 from datetime import datetime
 from typing import Any
 
+import orjson
 import resend
 from langchain_core.tools import tool
-from langchain_openai import ChatOpenAI
 
+from core.cache import TTLCache
 from core.database import get_session
 from core.db_models import (
     EmailThread,
@@ -24,7 +24,6 @@ from core.db_models import (
     MessageDirection,
     MessageStatusEnum,
     Rider,
-    to_json,
 )
 from prompts.outreach_prompts import CLASSIFICATION_PROMPT
 
@@ -102,6 +101,32 @@ def get_email_thread(thread_id: str) -> dict:
         return result
 
 
+# Threads reused across back-to-back outreach preloads (retries, batches).
+# Kept short because inbound replies are written outside this process.
+THREAD_CACHE_TTL_SECONDS = 5
+_thread_cache = TTLCache(maxsize=1024, ttl=THREAD_CACHE_TTL_SECONDS)
+
+
+def get_cached_email_thread(thread_id: str) -> dict:
+    """Return get_email_thread's result, cached for THREAD_CACHE_TTL_SECONDS.
+
+    Errors (unknown thread) are not cached. The returned dict is shared
+    between callers and must not be mutated.
+    """
+    key = ("thread", thread_id)
+    thread = _thread_cache.get(key)
+    if thread is None:
+        thread = get_email_thread.func(thread_id=thread_id)
+        if "error" not in thread:
+            _thread_cache.set(key, thread)
+    return thread
+
+
+def invalidate_email_thread(thread_id: str) -> None:
+    """Drop a cached thread after a message is added to it."""
+    _thread_cache.pop(("thread", thread_id))
+
+
 # =============================================================================
 # Classification Tool
 # =============================================================================
@@ -121,6 +146,9 @@ def classify_reply(message_body: str) -> dict:
         - bucket: Classification bucket (acknowledgment, question, update, escalation)
         - reasoning: Brief explanation of the classification
     """
+    # Deferred so importing the outreach tools skips the OpenAI client
+    from langchain_openai import ChatOpenAI
+
     model = ChatOpenAI(
         model=os.environ.get("OPENAI_MODEL", "gpt-4.1-mini"),
         temperature=0,
@@ -141,9 +169,9 @@ def classify_reply(message_body: str) -> dict:
         elif "```" in content:
             content = content.split("```")[1].split("```")[0]
 
-        result = json.loads(content.strip())
+        result = orjson.loads(content.strip())
         return result
-    except (json.JSONDecodeError, IndexError):
+    except (orjson.JSONDecodeError, IndexError):
         return {
             "bucket": "escalation",
             "reasoning": f"Failed to parse classification response: {content[:200]}",
@@ -194,7 +222,7 @@ def _save_message_to_db(thread_id: str, to: list[str], body: str, sent: bool) ->
             message_id=message_id,
             thread_id=thread_id,
             from_email=FROM_EMAIL,
-            to_emails=to_json(to),
+            to_emails=to,
             sent_at=datetime.now(),  # Use local time (PrismaDateTime expects local, not UTC)
             body=body,
             direction=MessageDirection.OUTBOUND,
@@ -202,7 +230,8 @@ def _save_message_to_db(thread_id: str, to: list[str], body: str, sent: bool) ->
         )
         session.add(new_message)
         session.commit()
-    
+
+    invalidate_email_thread(thread_id)
     return message_id
 
 
@@ -2,7 +2,9 @@
 
 from langchain_core.tools import tool
 from pydantic import BaseModel
+from sqlalchemy import func, select
 
+from core.cache import TTLCache
 from core.database import get_session
 from core.db_models import Vanpool, Rider, Employee
 
@@ -16,6 +18,27 @@ class VanpoolRosterResult(BaseModel):
     riders: list[dict]  # List of employee profiles
 
 
+# Correlated rider count so summaries don't lazy-load every Rider row
+_RIDER_COUNT = (
+    select(func.count(Rider.id))
+    .where(Rider.vanpool_id == Vanpool.vanpool_id)
+    .correlate(Vanpool)
+    .scalar_subquery()
+    .label("rider_count")
+)
+
+# Only the columns Vanpool.to_dict() serializes
+_VANPOOL_SUMMARY_COLUMNS = (
+    *(getattr(Vanpool, name) for name in Vanpool.SUMMARY_COLUMNS),
+    _RIDER_COUNT,
+)
+
+
+def _vanpool_summary(row) -> dict:
+    """Build the Vanpool.to_dict() shape from a summary-column row."""
+    return Vanpool.summary_dict(row, row.rider_count)
+
+
 @tool
 def get_vanpool_roster(vanpool_id: str) -> dict:
     """Return a vanpool's full roster and rider profiles.
@@ -34,9 +57,9 @@ def get_vanpool_roster(vanpool_id: str) -> dict:
         - error: Error message if the vanpool is not found.
     """
     with get_session() as session:
-        # Find the vanpool
+        # Find the vanpool (only the columns the roster reports)
         vanpool = (
-            session.query(Vanpool)
+            session.query(Vanpool.vanpool_id, Vanpool.work_site)
             .filter(Vanpool.vanpool_id == vanpool_id)
             .first()
         )
@@ -44,18 +67,16 @@ def get_vanpool_roster(vanpool_id: str) -> dict:
         if vanpool is None:
             return {"error": f"Vanpool {vanpool_id} not found"}
 
-        # Get riders with their employee info via join
-        riders_with_employees = (
-            session.query(Rider, Employee)
-            .join(Employee, Rider.employee_id == Employee.employee_id)
+        # Get rider employee profiles via join
+        employees = (
+            session.query(Employee)
+            .join(Rider, Rider.employee_id == Employee.employee_id)
             .filter(Rider.vanpool_id == vanpool_id)
             .all()
         )
 
         # Build rider list
-        riders = []
-        for _, employee in riders_with_employees:
-            riders.append(employee.to_dict())
+        riders = [employee.to_dict() for employee in employees]
 
         return {
             "vanpool_id": vanpool.vanpool_id,
@@ -65,6 +86,31 @@ def get_vanpool_roster(vanpool_id: str) -> dict:
         }
 
 
+# Rosters reused across back-to-back preloads of the same vanpool (e.g. HITL resumes)
+ROSTER_CACHE_TTL_SECONDS = 30
+_roster_cache = TTLCache(maxsize=256, ttl=ROSTER_CACHE_TTL_SECONDS)
+
+
+def get_cached_vanpool_roster(vanpool_id: str) -> dict:
+    """Return get_vanpool_roster's result, cached for ROSTER_CACHE_TTL_SECONDS.
+
+    Errors (unknown vanpool) are not cached. The returned dict is shared
+    between callers and must not be mutated.
+    """
+    key = ("roster", vanpool_id)
+    roster = _roster_cache.get(key)
+    if roster is None:
+        roster = get_vanpool_roster.func(vanpool_id=vanpool_id)
+        if "error" not in roster:
+            _roster_cache.set(key, roster)
+    return roster
+
+
+def invalidate_vanpool_roster(vanpool_id: str) -> None:
+    """Drop a cached roster after its riders change."""
+    _roster_cache.pop(("roster", vanpool_id))
+
+
 @tool
 def get_vanpool_info(vanpool_id: str) -> dict:
     """Get basic information about a vanpool (without full rider details).
@@ -82,7 +128,7 @@ def get_vanpool_info(vanpool_id: str) -> dict:
     """
     with get_session() as session:
         vanpool = (
-            session.query(Vanpool)
+            session.query(*_VANPOOL_SUMMARY_COLUMNS)
             .filter(Vanpool.vanpool_id == vanpool_id)
             .first()
         )
@@ -90,7 +136,7 @@ def get_vanpool_info(vanpool_id: str) -> dict:
         if vanpool is None:
             return {"error": f"Vanpool {vanpool_id} not found"}
 
-        return vanpool.to_dict()
+        return _vanpool_summary(vanpool)
 
 
 @tool
@@ -110,7 +156,7 @@ def list_vanpools(status: str | None = None) -> dict:
         - vanpools: List of vanpool summaries
     """
     with get_session() as session:
-        query = session.query(Vanpool)
+        query = session.query(*_VANPOOL_SUMMARY_COLUMNS)
 
         if status:
             query = query.filter(Vanpool.status == status)
@@ -119,5 +165,5 @@ def list_vanpools(status: str | None = None) -> dict:
 
         return {
             "count": len(vanpools),
-            "vanpools": [vp.to_dict() for vp in vanpools],
+            "vanpools": [_vanpool_summary(vp) for vp in vanpools],
         }
@@ -0,0 +1,14 @@
+-- CreateIndex
+CREATE INDEX "vanpools_status_work_site_idx" ON "vanpools"("status", "work_site");
+
+-- CreateIndex
+CREATE INDEX "employees_status_work_site_idx" ON "employees"("status", "work_site");
+
+-- CreateIndex
+CREATE INDEX "cases_vanpool_id_status_idx" ON "cases"("vanpool_id", "status");
+
+-- CreateIndex
+CREATE INDEX "email_threads_vanpool_id_status_idx" ON "email_threads"("vanpool_id", "status");
+
+-- CreateIndex
+CREATE INDEX "messages_thread_id_status_idx" ON "messages"("thread_id", "status");
@@ -203,7 +203,7 @@ def seed_database():
                     message_id=msg_data["message_id"],
                     thread_id=thread_data["thread_id"],
                     from_email=msg_data["from"],
-                    to_emails=json.dumps(msg_data["to"]),
+                    to_emails=msg_data["to"],
                     sent_at=parse_date(msg_data["sent_at"]),
                     body=msg_data["body"],
                     direction=msg_data["direction"],
@@ -0,0 +1,15 @@
+"""Pytest configuration shared by the test suite.
+
+Puts packages/ and the API app on sys.path before test modules are
+imported, so tests can import core, agents, tools and pool_patrol_api
+directly.
+"""
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+
+for path in (project_root / "packages", project_root / "apps" / "api"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
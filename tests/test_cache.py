@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""Tests for the in-process TTL cache and the list response cache.
+
+Covers core.cache.TTLCache (expiry, LRU eviction, namespace clearing) and
+pool_patrol_api.services.response_cache (cached list bodies and
+invalidation). No database or API keys needed. Run from the project root:
+
+    poetry run pytest tests/test_cache.py
+"""
+
+import orjson
+import pytest
+from pydantic import TypeAdapter
+
+import core.cache
+from core.cache import TTLCache
+from core.models import Message
+from pool_patrol_api.services import response_cache
+from pool_patrol_api.services.response_cache import cached_json_response, invalidate
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(core.cache.time, "monotonic", fake)
+    return fake
+
+
+# =============================================================================
+# TTLCache
+# =============================================================================
+
+
+def test_get_returns_default_for_missing_key():
+    cache = TTLCache(maxsize=4, ttl=10)
+
+    assert cache.get(("cases", None)) is None
+    assert cache.get(("cases", None), "missing") == "missing"
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set(("cases", None), b"[]")
+
+    clock.now += 9.9
+    assert cache.get(("cases", None)) == b"[]"
+
+    clock.now += 0.2
+    assert cache.get(("cases", None)) is None
+    # Expired entries are dropped on read
+    assert len(cache) == 0
+
+
+def test_set_refreshes_expiry(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("key", 1)
+
+    clock.now += 8
+    cache.set("key", 2)
+    clock.now += 8
+
+    assert cache.get("key") == 2
+
+
+def test_evicts_least_recently_used_when_full():
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_cached_none_is_distinct_from_missing():
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("key", None)
+
+    assert cache.get("key", "missing") is None
+
+
+def test_pop_drops_a_single_entry():
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.pop("a")
+    cache.pop("not-there")
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+def test_clear_by_namespace_keeps_other_namespaces():
+    cache = TTLCache(maxsize=8, ttl=10)
+    cache.set(("cases", "open", None), 1)
+    cache.set(("cases", None, "VP-101"), 2)
+    cache.set(("vanpools", None, None), 3)
+    cache.set("cases", 4)  # Not a tuple key, so not part of the namespace
+
+    cache.clear("cases")
+
+    assert cache.get(("cases", "open", None)) is None
+    assert cache.get(("cases", None, "VP-101")) is None
+    assert cache.get(("vanpools", None, None)) == 3
+    assert cache.get("cases") == 4
+
+
+def test_clear_without_namespace_drops_everything():
+    cache = TTLCache(maxsize=8, ttl=10)
+    cache.set(("cases", None), 1)
+    cache.set(("vanpools", None), 2)
+
+    cache.clear()
+
+    assert len(cache) == 0
+
+
+# =============================================================================
+# List Response Cache
+# =============================================================================
+
+
+_INT_LIST_ADAPTER = TypeAdapter(list[int])
+
+
+@pytest.fixture
+def fresh_response_cache(monkeypatch):
+    cache = TTLCache(maxsize=16, ttl=10)
+    monkeypatch.setattr(response_cache, "response_cache", cache)
+    return cache
+
+
+def test_cached_json_response_builds_once(fresh_response_cache):
+    calls = []
+
+    def build():
+        calls.append(1)
+        return [1, 2, 3]
+
+    first = cached_json_response(("cases", None), _INT_LIST_ADAPTER, build)
+    second = cached_json_response(("cases", None), _INT_LIST_ADAPTER, build)
+
+    assert len(calls) == 1
+    assert first.media_type == "application/json"
+    assert orjson.loads(first.body) == [1, 2, 3]
+    assert second.body == first.body
+
+
+def test_cached_json_response_keys_on_filters(fresh_response_cache):
+    open_cases = cached_json_response(("cases", "open"), _INT_LIST_ADAPTER, lambda: [1])
+    all_cases = cached_json_response(("cases", None), _INT_LIST_ADAPTER, lambda: [1, 2])
+
+    assert orjson.loads(open_cases.body) == [1]
+    assert orjson.loads(all_cases.body) == [1, 2]
+
+
+def test_invalidate_drops_only_named_namespaces(fresh_response_cache):
+    cached_json_response(("cases", None), _INT_LIST_ADAPTER, lambda: [1])
+    cached_json_response(("vanpools", None), _INT_LIST_ADAPTER, lambda: [2])
+    cached_json_response(("employees", None), _INT_LIST_ADAPTER, lambda: [3])
+
+    invalidate("cases", "vanpools")
+
+    # Rebuilt after invalidation, still cached otherwise
+    cases = cached_json_response(("cases", None), _INT_LIST_ADAPTER, lambda: [10])
+    vanpools = cached_json_response(("vanpools", None), _INT_LIST_ADAPTER, lambda: [20])
+    employees = cached_json_response(("employees", None), _INT_LIST_ADAPTER, lambda: [30])
+
+    assert orjson.loads(cases.body) == [10]
+    assert orjson.loads(vanpools.body) == [20]
+    assert orjson.loads(employees.body) == [3]
+
+
+def test_cached_json_response_serializes_by_alias(fresh_response_cache):
+    message = Message.model_validate({
+        "message_id": "MSG-1",
+        "from": "coordinator@example.com",
+        "to": ["rider@example.com"],
+        "sent_at": "2026-01-01T09:00:00Z",
+        "body": "Hello",
+        "direction": "outbound",
+        "status": "sent",
+    })
+
+    response = cached_json_response(
+        ("email_threads", "MSG-1"), TypeAdapter(list[Message]), lambda: [message]
+    )
+
+    body = orjson.loads(response.body)
+    assert body[0]["from"] == "coordinator@example.com"
+    assert "from_email" not in body[0]
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Tests for the case API routes.
+
+Covers POST /api/cases/{case_id}/cancel-vanpool: the guarded
+UPDATE ... RETURNING path and its 200/400/404 responses. Each test runs
+against a throwaway SQLite database, so the dev database is untouched.
+Run from the project root:
+
+    poetry run pytest tests/test_cases_api.py
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from core.database import get_session, init_db, reset_engine
+from core.db_models import Case, CaseStatus, Vanpool, VanpoolStatus, to_json
+from pool_patrol_api.routers import cases
+from tools.case_cache import cached_case_lookup
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Client for the case routes backed by an empty temporary database."""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'test.db'}")
+    reset_engine()
+    init_db()
+
+    app = FastAPI()
+    app.include_router(cases.router)
+    with TestClient(app) as test_client:
+        yield test_client
+
+    reset_engine()
+
+
+def _add_vanpool(vanpool_id: str) -> None:
+    with get_session() as session:
+        session.add(Vanpool(
+            vanpool_id=vanpool_id,
+            work_site="Test Site",
+            work_site_address="1 Test Way",
+            work_site_coords=to_json({"lat": 0.0, "lng": 0.0}),
+            capacity=8,
+            status=VanpoolStatus.ACTIVE,
+        ))
+
+
+def _add_case(case_id: str, vanpool_id: str, status: str) -> None:
+    with get_session() as session:
+        session.add(Case(
+            case_id=case_id,
+            vanpool_id=vanpool_id,
+            status=status,
+            meta=to_json({"reason": "shift_mismatch", "details": "test"}),
+        ))
+
+
+def _case_row(case_id: str) -> Case:
+    with get_session() as session:
+        case = session.query(Case).filter(Case.case_id == case_id).one()
+        session.expunge(case)
+        return case
+
+
+def _vanpool_status(vanpool_id: str) -> str:
+    with get_session() as session:
+        return session.query(Vanpool.status).filter(Vanpool.vanpool_id == vanpool_id).scalar()
+
+
+# =============================================================================
+# Cancel Vanpool
+# =============================================================================
+
+
+def test_cancel_vanpool_cancels_case_and_suspends_vanpool(client):
+    _add_vanpool("VP-901")
+    _add_case("CASE-901", "VP-901", CaseStatus.PRE_CANCEL)
+
+    response = client.post("/api/cases/CASE-901/cancel-vanpool")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "cancelled": True,
+        "vanpool_id": "VP-901",
+        "case_id": "CASE-901",
+    }
+
+    case = _case_row("CASE-901")
+    assert case.status == CaseStatus.CANCELLED
+    assert case.outcome == (
+        "Vanpool VP-901 service cancelled due to unresolved eligibility issues"
+    )
+    assert case.resolved_at is not None
+    assert _vanpool_status("VP-901") == VanpoolStatus.SUSPENDED
+
+
+def test_cancel_vanpool_clears_cached_case_lookups(client):
+    _add_vanpool("VP-901")
+    _add_case("CASE-901", "VP-901", CaseStatus.PRE_CANCEL)
+    cached_case_lookup(("case_status", "CASE-901"), lambda: {"status": "pre_cancel"})
+
+    client.post("/api/cases/CASE-901/cancel-vanpool")
+
+    reloaded = cached_case_lookup(("case_status", "CASE-901"), lambda: {"status": "cancelled"})
+    assert reloaded == {"status": "cancelled"}
+
+
+def test_cancel_vanpool_rejects_case_not_in_pre_cancel(client):
+    _add_vanpool("VP-901")
+    _add_case("CASE-901", "VP-901", CaseStatus.HITL_REVIEW)
+
+    response = client.post("/api/cases/CASE-901/cancel-vanpool")
+
+    assert response.status_code == 400
+    assert "current: hitl_review" in response.json()["detail"]
+    assert _case_row("CASE-901").status == CaseStatus.HITL_REVIEW
+    assert _vanpool_status("VP-901") == VanpoolStatus.ACTIVE
+
+
+def test_cancel_vanpool_twice_returns_400(client):
+    _add_vanpool("VP-901")
+    _add_case("CASE-901", "VP-901", CaseStatus.PRE_CANCEL)
+
+    assert client.post("/api/cases/CASE-901/cancel-vanpool").status_code == 200
+    response = client.post("/api/cases/CASE-901/cancel-vanpool")
+
+    assert response.status_code == 400
+    assert "current: cancelled" in response.json()["detail"]
+
+
+def test_cancel_vanpool_unknown_case_returns_404(client):
+    response = client.post("/api/cases/CASE-404/cancel-vanpool")
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Case CASE-404 not found"
+
+
+def test_cancel_vanpool_missing_vanpool_rolls_back_case(client):
+    # SQLite doesn't enforce the foreign key, so the case can point nowhere
+    _add_case("CASE-901", "VP-404", CaseStatus.PRE_CANCEL)
+
+    response = client.post("/api/cases/CASE-901/cancel-vanpool")
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Vanpool VP-404 not found"
+    case = _case_row("CASE-901")
+    assert case.status == CaseStatus.PRE_CANCEL
+    assert case.outcome is None
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""Tests for the mock-data DataService.
+
+Checks the ID indexes and filter buckets against plain scans of the loaded
+records, so the fast paths keep the original first-match and load-order
+semantics, and checks that a bad pickle sidecar falls back to the JSON.
+Uses the project's mock/ data (copied to a temp directory when a test
+needs to edit it). Run from the project root:
+
+    poetry run pytest tests/test_data_service.py
+"""
+
+import pickle
+import shutil
+from pathlib import Path
+
+import orjson
+import pytest
+
+from core.models import CaseStatus, EmployeeStatus, ThreadStatus, VanpoolStatus
+from pool_patrol_api.services.data_service import DataService
+
+MOCK_PATH = Path(__file__).parent.parent / "mock"
+
+
+@pytest.fixture(scope="module")
+def service() -> DataService:
+    return DataService()
+
+
+@pytest.fixture
+def mock_copy(tmp_path) -> Path:
+    """Writable copy of the mock JSON files (without pickle sidecars)."""
+    for source in MOCK_PATH.glob("*.json"):
+        shutil.copy(source, tmp_path / source.name)
+    return tmp_path
+
+
+def _append_records(mock_dir: Path, filename: str, records: list[dict]) -> None:
+    path = mock_dir / filename
+    data = orjson.loads(path.read_bytes())
+    data.extend(records)
+    path.write_bytes(orjson.dumps(data))
+
+
+# =============================================================================
+# ID Indexes
+# =============================================================================
+
+
+def test_single_record_getters_match_scans(service):
+    for vanpool in service.get_vanpools():
+        assert service.get_vanpool(vanpool.vanpool_id) is vanpool
+    for employee in service.get_employees():
+        assert service.get_employee(employee.employee_id) is employee
+        assert service.get_employee_by_email(employee.email) is employee
+    for case in service.get_cases():
+        assert service.get_case(case.case_id) is case
+        assert service.has_case(case.case_id)
+    for thread in service.get_email_threads():
+        assert service.get_email_thread(thread.thread_id) is thread
+        assert service.get_thread_messages(thread.thread_id) == thread.messages
+
+
+def test_unknown_ids_return_none(service):
+    assert service.get_vanpool("VP-404") is None
+    assert service.get_vanpool_riders("VP-404") is None
+    assert service.get_employee("EMP-404") is None
+    assert service.get_employee_by_email("nobody@example.com") is None
+    assert service.get_employee_shifts("EMP-404") is None
+    assert service.get_case("CASE-404") is None
+    assert not service.has_case("CASE-404")
+    assert service.get_case_emails("CASE-404") == ()
+    assert service.get_email_thread("THREAD-404") is None
+    assert service.get_thread_messages("THREAD-404") is None
+
+
+def test_case_emails_keep_load_order(service):
+    threads = service.get_email_threads()
+    for case in service.get_cases():
+        expected = tuple(t for t in threads if t.case_id == case.case_id)
+        assert service.get_case_emails(case.case_id) == expected
+
+
+def test_duplicate_ids_resolve_to_first_record(mock_copy):
+    original = orjson.loads((mock_copy / "cases.json").read_bytes())[0]
+    duplicate = {**original, "outcome": "duplicate record"}
+    _append_records(mock_copy, "cases.json", [duplicate])
+
+    service = DataService(mock_copy)
+
+    case = service.get_case(original["case_id"])
+    assert case.outcome == original.get("outcome")
+    assert service.get_cases()[-1].outcome == "duplicate record"
+
+
+# =============================================================================
+# Pickle Sidecars
+# =============================================================================
+
+
+@pytest.mark.parametrize("sidecar", [
+    pickle.dumps(("stamp", "value", "extra"))[:-5],  # Torn mid-write
+    pickle.dumps(("stamp", "value", "extra")),  # Wrong shape
+    b"not a pickle",
+])
+def test_bad_sidecar_falls_back_to_json(mock_copy, sidecar):
+    expected = DataService(mock_copy).get_cases()
+    (mock_copy / ".cases.pkl").write_bytes(sidecar)
+
+    service = DataService(mock_copy)
+
+    assert service.get_cases() == expected
+    # The rebuilt sidecar replaced the bad one, with no temp files left behind
+    assert DataService(mock_copy).get_cases() == expected
+    assert not list(mock_copy.glob("*.tmp.pkl"))
+
+
+# =============================================================================
+# Filters
+# =============================================================================
+
+# Partial, mixed-case and non-matching work_site filters
+WORK_SITES = [None, "fremont", "FREM", "San", "x"]
+
+
+def _site_matches(record, work_site: str | None) -> bool:
+    return work_site is None or work_site.lower() in record.work_site.lower()
+
+
+@pytest.mark.parametrize("work_site", WORK_SITES)
+@pytest.mark.parametrize("status", [None, *VanpoolStatus])
+def test_vanpool_filters_match_scan(service, status, work_site):
+    expected = tuple(
+        v for v in service.get_vanpools()
+        if (status is None or v.status == status) and _site_matches(v, work_site)
+    )
+    assert service.get_vanpools(status=status, work_site=work_site) == expected
+
+
+@pytest.mark.parametrize("work_site", WORK_SITES)
+@pytest.mark.parametrize("status", [None, *EmployeeStatus])
+def test_employee_filters_match_scan(service, status, work_site):
+    expected = tuple(
+        e for e in service.get_employees()
+        if (status is None or e.status == status) and _site_matches(e, work_site)
+    )
+    assert service.get_employees(status=status, work_site=work_site) == expected
+
+
+@pytest.mark.parametrize("status", [None, *CaseStatus])
+def test_case_filters_match_scan(service, status):
+    all_cases = service.get_cases()
+    for vanpool_id in [None, "VP-404", *{c.vanpool_id for c in all_cases}]:
+        expected = tuple(
+            c for c in all_cases
+            if (status is None or c.status == status)
+            and (vanpool_id is None or c.vanpool_id == vanpool_id)
+        )
+        assert service.get_cases(status=status, vanpool_id=vanpool_id) == expected
+
+
+@pytest.mark.parametrize("status", [None, *ThreadStatus])
+def test_email_thread_filters_match_scan(service, status):
+    all_threads = service.get_email_threads()
+    for vanpool_id in [None, "VP-404", *{t.vanpool_id for t in all_threads}]:
+        expected = tuple(
+            t for t in all_threads
+            if (status is None or t.status == status)
+            and (vanpool_id is None or t.vanpool_id == vanpool_id)
+        )
+        assert service.get_email_threads(status=status, vanpool_id=vanpool_id) == expected
+
+
+def test_filters_return_tuples(service):
+    assert isinstance(service.get_vanpools(work_site="fremont"), tuple)
+    assert isinstance(service.get_employees(status=EmployeeStatus.ACTIVE), tuple)
+    assert isinstance(service.get_cases(status=CaseStatus.OPEN), tuple)
+    assert isinstance(service.get_email_threads(vanpool_id="VP-404"), tuple)
+
+
+def test_work_site_filter_splits_mixed_sites(mock_copy):
+    # The mock data has a single site; move some records to a second one
+    for filename in ("vanpools.json", "employees.json"):
+        path = mock_copy / filename
+        records = orjson.loads(path.read_bytes())
+        for record in records[::3]:
+            record["work_site"] = "San Jose Office"
+        path.write_bytes(orjson.dumps(records))
+
+    service = DataService(mock_copy)
+
+    for getter, records in (
+        (service.get_vanpools, service.get_vanpools()),
+        (service.get_employees, service.get_employees()),
+    ):
+        san_jose = getter(work_site="san jose")
+        fremont = getter(work_site="Fremont")
+        assert san_jose == tuple(r for r in records if r.work_site == "San Jose Office")
+        assert fremont == tuple(r for r in records if r.work_site == "Fremont Factory")
+        assert 0 < len(san_jose) < len(records)
+        assert len(san_jose) + len(fremont) == len(records)
+
+
+# =============================================================================
+# Vanpool Membership
+# =============================================================================
+
+
+def _give_riders_emails(mock_dir: Path, vanpool_index: int, reverse: bool = False) -> str:
+    """Fill in rider emails for one vanpool (mock riders carry only IDs)."""
+    emails = {
+        e["employee_id"]: e["email"]
+        for e in orjson.loads((mock_dir / "employees.json").read_bytes())
+    }
+    path = mock_dir / "vanpools.json"
+    vanpools = orjson.loads(path.read_bytes())
+    vanpool = vanpools[vanpool_index]
+    for rider in vanpool["riders"]:
+        rider["email"] = emails[rider["employee_id"]]
+    if reverse:
+        vanpool["riders"].reverse()
+    path.write_bytes(orjson.dumps(vanpools))
+    return vanpool["vanpool_id"]
+
+
+def _members_by_scan(service: DataService, vanpool_id: str, **filters) -> set[str]:
+    rider_emails = {r.email for r in service.get_vanpool_riders(vanpool_id)}
+    return {e.employee_id for e in service.get_employees(**filters) if e.email in rider_emails}
+
+
+def _ids(employees) -> set[str]:
+    return {e.employee_id for e in employees}
+
+
+def test_vanpool_members_match_scan(mock_copy):
+    vanpool_id = _give_riders_emails(mock_copy, 0)
+    service = DataService(mock_copy)
+
+    members = service.get_employees(vanpool_id=vanpool_id)
+
+    assert members
+    assert _ids(members) == _members_by_scan(service, vanpool_id)
+    assert len(members) == len(_ids(members))
+    for status in EmployeeStatus:
+        assert _ids(service.get_employees(status=status, vanpool_id=vanpool_id)) == (
+            _members_by_scan(service, vanpool_id, status=status)
+        )
+    assert service.get_employees(work_site="fremont", vanpool_id=vanpool_id) == members
+    assert service.get_employees(work_site="x", vanpool_id=vanpool_id) == ()
+
+
+def test_vanpool_members_follow_rider_order(mock_copy):
+    vanpool_id = _give_riders_emails(mock_copy, 0, reverse=True)
+    service = DataService(mock_copy)
+
+    members = service.get_employees(vanpool_id=vanpool_id)
+
+    riders = service.get_vanpool_riders(vanpool_id)
+    assert [e.email for e in members] == [r.email for r in riders]
+
+
+def test_unknown_vanpool_has_no_members(service):
+    assert service.get_employees(vanpool_id="VP-404") == ()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Tests for core.database session handling.
+
+Covers session_scope(): get_session() calls inside a scope share its
+session, the scope commits or rolls back once, and other threads still
+get their own session. Each test runs against a throwaway SQLite
+database. Run from the project root:
+
+    poetry run pytest tests/test_database.py
+"""
+
+import asyncio
+import contextvars
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from core.database import get_session, init_db, reset_engine, session_scope
+from core.db_models import Vanpool, to_json
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    """Point the engines at an empty temporary database."""
+    path = tmp_path / "test.db"
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{path}")
+    reset_engine()
+    init_db()
+    yield path
+    reset_engine()
+
+
+def _vanpool(vanpool_id: str) -> Vanpool:
+    return Vanpool(
+        vanpool_id=vanpool_id,
+        work_site="Test Site",
+        work_site_address="1 Test Way",
+        work_site_coords=to_json({"lat": 0.0, "lng": 0.0}),
+        capacity=8,
+    )
+
+
+def _committed_vanpool_ids(db_path) -> set[str]:
+    """Read vanpool IDs over a separate connection (sees committed rows only)."""
+    with sqlite3.connect(db_path) as connection:
+        return {row[0] for row in connection.execute("SELECT vanpool_id FROM vanpools")}
+
+
+# =============================================================================
+# Session Sharing
+# =============================================================================
+
+
+def test_get_session_reuses_scope_session(db_path):
+    with session_scope() as scoped:
+        with get_session() as first:
+            pass
+        with get_session() as second:
+            pass
+
+    assert first is scoped
+    assert second is scoped
+
+
+def test_nested_scope_reuses_outer_session(db_path):
+    with session_scope() as outer:
+        with session_scope() as inner:
+            pass
+
+    assert inner is outer
+
+
+def test_sessions_are_separate_outside_a_scope(db_path):
+    with session_scope() as scoped:
+        pass
+
+    with get_session() as first:
+        pass
+    with get_session() as second:
+        pass
+
+    assert first is not scoped
+    assert first is not second
+
+
+def test_other_threads_get_their_own_session(db_path):
+    with session_scope() as scoped:
+        # Copy the context so the thread sees the scope's ContextVar value
+        context = contextvars.copy_context()
+
+        def open_session():
+            with get_session() as session:
+                return session
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(context.run, open_session).result()
+
+    assert other is not scoped
+
+
+def test_to_thread_gets_its_own_session(db_path):
+    def open_session():
+        with get_session() as session:
+            return session
+
+    async def run():
+        with session_scope() as scoped:
+            other = await asyncio.to_thread(open_session)
+        return scoped, other
+
+    scoped, other = asyncio.run(run())
+
+    assert other is not scoped
+
+
+# =============================================================================
+# Commit and Rollback
+# =============================================================================
+
+
+def test_scope_commits_once_at_exit(db_path):
+    with session_scope():
+        with get_session() as session:
+            session.add(_vanpool("VP-901"))
+        # The inner block didn't commit; the scope still owns the transaction
+        assert _committed_vanpool_ids(db_path) == set()
+
+        with get_session() as session:
+            session.add(_vanpool("VP-902"))
+
+    assert _committed_vanpool_ids(db_path) == {"VP-901", "VP-902"}
+
+
+def test_scope_rolls_back_everything_on_error(db_path):
+    with pytest.raises(RuntimeError):
+        with session_scope():
+            with get_session() as session:
+                session.add(_vanpool("VP-901"))
+            raise RuntimeError("lookup failed")
+
+    assert _committed_vanpool_ids(db_path) == set()
+
+
+def test_scope_is_cleared_after_error(db_path):
+    with pytest.raises(RuntimeError):
+        with session_scope() as scoped:
+            raise RuntimeError("lookup failed")
+
+    with get_session() as session:
+        session.add(_vanpool("VP-901"))
+
+    assert session is not scoped
+    assert _committed_vanpool_ids(db_path) == {"VP-901"}
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Tests for the Outreach Agent's shared checkpointer.
+
+Covers releasing checkpoint threads after a run: finished runs are deleted
+from the process-wide saver, interrupted (HITL) runs are kept for resume,
+and a missing thread never reaches the agent. The agent is replaced by a one-node LangGraph graph on the same kind of
+saver, so no database or API keys are needed. Run from the project root:
+
+    poetry run pytest tests/test_outreach_checkpoints.py
+"""
+
+import asyncio
+from typing import Annotated, Any, TypedDict
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.message import add_messages
+from langgraph.types import interrupt
+
+from agents import outreach
+from agents.structures import OutreachRequest, OutreachResult
+from agents.utils import create_checkpointer
+
+
+class _State(TypedDict, total=False):
+    messages: Annotated[list, add_messages]
+    structured_response: Any
+
+
+def _fake_agent(interrupt_run: bool = False):
+    """Compile a one-node graph that answers like the Outreach agent."""
+
+    def model(state: _State) -> dict:
+        if interrupt_run:
+            interrupt({"action": "send_email_for_review"})
+        return {
+            "structured_response": OutreachResult(
+                email_thread_id="THREAD-001", bucket="acknowledgment", sent=True
+            )
+        }
+
+    graph = StateGraph(_State)
+    graph.add_node("model", model)
+    graph.add_edge(START, "model")
+    graph.add_edge("model", END)
+    return graph.compile(checkpointer=create_checkpointer())
+
+
+def _thread() -> dict:
+    return {
+        "thread_id": "THREAD-001",
+        "case_id": "CASE-001",
+        "vanpool_id": "VP-101",
+        "subject": "Vanpool eligibility check",
+        "status": "active",
+        "messages": [],
+    }
+
+
+@pytest.fixture
+def use_agent(monkeypatch):
+    """Install a fake agent as the shared Outreach agent."""
+    monkeypatch.setattr(outreach, "_preload_thread_data", lambda thread_id: _thread())
+
+    def install(agent):
+        monkeypatch.setattr(outreach, "_agent", agent)
+        return agent
+
+    return install
+
+
+REQUEST = OutreachRequest(email_thread_id="THREAD-001")
+
+
+# =============================================================================
+# Finished Runs
+# =============================================================================
+
+
+def test_async_runs_release_their_threads(use_agent):
+    agent = use_agent(_fake_agent())
+
+    for _ in range(2):
+        result = asyncio.run(outreach.handle_outreach(REQUEST))
+        assert result.sent
+        assert len(agent.checkpointer.storage) == 0
+
+
+def test_sync_runs_release_their_threads(use_agent):
+    agent = use_agent(_fake_agent())
+
+    for _ in range(2):
+        assert outreach.handle_outreach_sync(REQUEST).sent
+        assert len(agent.checkpointer.storage) == 0
+
+
+def test_streamed_runs_release_their_threads(use_agent):
+    agent = use_agent(_fake_agent())
+
+    async def run() -> list:
+        return [item async for item in outreach.handle_outreach_stream(REQUEST)]
+
+    for _ in range(2):
+        items = asyncio.run(run())
+        assert items[-1].sent
+        assert len(agent.checkpointer.storage) == 0
+
+
+def test_batch_runs_release_their_threads(use_agent):
+    agent = use_agent(_fake_agent())
+
+    results = asyncio.run(outreach.handle_outreach_batch([REQUEST, REQUEST, REQUEST]))
+
+    assert all(r.sent for r in results)
+    assert len(agent.checkpointer.storage) == 0
+
+
+# =============================================================================
+# Interrupted Runs
+# =============================================================================
+
+
+def test_interrupted_runs_keep_their_threads(use_agent):
+    agent = use_agent(_fake_agent(interrupt_run=True))
+
+    outreach.handle_outreach_sync(REQUEST)
+    asyncio.run(outreach.handle_outreach(REQUEST))
+
+    # One thread per run, left in place for the HITL resume
+    assert len(agent.checkpointer.storage) == 2
+
+
+def test_interrupted_run_escalates_for_its_thread(use_agent):
+    use_agent(_fake_agent(interrupt_run=True))
+
+    result = outreach.handle_outreach_sync(REQUEST)
+
+    # No structured response yet, so the escalation default is stamped with the thread
+    assert result.bucket == "escalation"
+    assert result.hitl_required
+    assert result.email_thread_id == "THREAD-001"
+
+
+# =============================================================================
+# Missing Threads
+# =============================================================================
+
+
+def test_missing_thread_skips_agent_and_logs(monkeypatch, caplog):
+    monkeypatch.setattr(outreach, "_preload_thread_data", lambda thread_id: None)
+    agent = _fake_agent()
+    monkeypatch.setattr(outreach, "_agent", agent)
+
+    with caplog.at_level("INFO", logger="agents.outreach"):
+        result = outreach.handle_outreach_sync(OutreachRequest(email_thread_id="THREAD-404"))
+
+    assert result.email_thread_id == "THREAD-404"
+    assert not result.sent
+    assert len(agent.checkpointer.storage) == 0
+    assert "THREAD-404 not found" in caplog.text
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Tests for the Outreach Agent's thread summary.
+
+Covers _summarize_thread (field pruning, body trimming and the token
+budget) and the _thread_json memo. Token counts use the ~4 characters per
+token estimate so results don't depend on tiktoken's downloadable
+encodings. No database or API keys needed. Run from the project root:
+
+    poetry run pytest tests/test_outreach_thread_summary.py
+"""
+
+import orjson
+import pytest
+
+from agents import outreach
+from agents.outreach import MAX_BODY_CHARS, _summarize_thread, _thread_json
+
+
+@pytest.fixture(autouse=True)
+def estimated_tokens(monkeypatch):
+    """Count tokens as len(text) // 4, as when tiktoken is unavailable."""
+    monkeypatch.setattr(outreach, "_get_encoding", lambda: None)
+
+
+def _message(n: int, direction: str, body: str = "Hello") -> dict:
+    return {
+        "id": f"row-{n}",
+        "message_id": f"MSG-{n:03d}",
+        "thread_id": "THREAD-001",
+        "from": "coordinator@example.com" if direction == "outbound" else "rider@example.com",
+        "to": ["rider@example.com"] if direction == "outbound" else ["coordinator@example.com"],
+        "sent_at": f"2026-01-{n:02d}T09:00:00",
+        "body": body,
+        "direction": direction,
+        "classification": None,
+        "status": "sent",
+        "created_at": f"2026-01-{n:02d}T09:00:00",
+    }
+
+
+def _thread(*messages: dict) -> dict:
+    return {
+        "thread_id": "THREAD-001",
+        "case_id": "CASE-001",
+        "vanpool_id": "VP-101",
+        "subject": "Vanpool eligibility check",
+        "status": "active",
+        "messages": list(messages),
+    }
+
+
+def _tokens(value) -> int:
+    return len(orjson.dumps(value, default=str).decode()) // 4
+
+
+# =============================================================================
+# Field Pruning and Body Trimming
+# =============================================================================
+
+
+def test_keeps_thread_fields_and_essential_message_fields():
+    summary = _summarize_thread(_thread(_message(1, "outbound"), _message(2, "inbound")))
+
+    assert {k: v for k, v in summary.items() if k != "messages"} == {
+        "thread_id": "THREAD-001",
+        "case_id": "CASE-001",
+        "vanpool_id": "VP-101",
+        "subject": "Vanpool eligibility check",
+        "status": "active",
+    }
+    assert set(summary["messages"][0]) == {
+        "message_id", "from", "to", "sent_at", "direction", "classification", "body",
+    }
+    assert "omitted_messages" not in summary
+
+
+def test_trims_bodies_except_latest_inbound():
+    long_body = "x" * (MAX_BODY_CHARS + 500)
+    summary = _summarize_thread(_thread(
+        _message(1, "outbound", long_body),
+        _message(2, "inbound", long_body),
+        _message(3, "inbound", long_body),
+        _message(4, "outbound", "short"),
+    ))
+
+    bodies = [m["body"] for m in summary["messages"]]
+    assert bodies[0] == "x" * MAX_BODY_CHARS + "... [trimmed]"
+    assert bodies[1] == "x" * MAX_BODY_CHARS + "... [trimmed]"
+    assert bodies[2] == long_body  # The reply being answered stays whole
+    assert bodies[3] == "short"
+
+
+def test_missing_body_becomes_empty_string():
+    message = _message(1, "inbound")
+    del message["body"]
+
+    summary = _summarize_thread(_thread(message))
+
+    assert summary["messages"][0]["body"] == ""
+
+
+def test_empty_thread():
+    summary = _summarize_thread(_thread())
+
+    assert summary["messages"] == []
+    assert "omitted_messages" not in summary
+
+
+# =============================================================================
+# Token Budget
+# =============================================================================
+
+
+def test_drops_oldest_messages_to_fit_budget():
+    messages = [
+        _message(n, "outbound" if n % 2 else "inbound", "y" * 400) for n in range(1, 11)
+    ]
+    full = _summarize_thread(_thread(*messages))
+    budget = _tokens(full) // 2
+
+    summary = _summarize_thread(_thread(*messages), max_tokens=budget)
+
+    omitted = summary["omitted_messages"]
+    assert 0 < omitted < len(messages)
+    assert summary["messages"] == full["messages"][omitted:]
+    # Everything except the omitted count fits the budget
+    del summary["omitted_messages"]
+    assert _tokens(summary) <= budget
+
+
+def test_never_drops_latest_inbound_or_later_messages():
+    messages = [
+        _message(1, "outbound", "a" * 1000),
+        _message(2, "inbound", "b" * 1000),
+        _message(3, "inbound", "c" * 8000),
+        _message(4, "outbound", "d" * 1000),
+    ]
+
+    summary = _summarize_thread(_thread(*messages), max_tokens=10)
+
+    assert summary["omitted_messages"] == 2
+    assert [m["message_id"] for m in summary["messages"]] == ["MSG-003", "MSG-004"]
+    assert summary["messages"][0]["body"] == "c" * 8000
+
+
+def test_without_inbound_keeps_latest_message():
+    messages = [_message(n, "outbound", "z" * 1000) for n in range(1, 5)]
+
+    summary = _summarize_thread(_thread(*messages), max_tokens=10)
+
+    assert summary["omitted_messages"] == 3
+    assert [m["message_id"] for m in summary["messages"]] == ["MSG-004"]
+
+
+# =============================================================================
+# Serialized Summary Memo
+# =============================================================================
+
+
+def test_thread_json_reuses_result_for_same_dict():
+    thread = _thread(_message(1, "inbound"))
+
+    first = _thread_json(thread)
+
+    assert _thread_json(thread) is first
+    assert orjson.loads(first) == orjson.loads(
+        orjson.dumps(_summarize_thread(thread), default=str)
+    )
+
+
+def test_thread_json_rebuilds_for_new_dict():
+    first = _thread_json(_thread(_message(1, "inbound", "first")))
+    second = _thread_json(_thread(_message(1, "inbound", "second")))
+
+    assert orjson.loads(first)["messages"][0]["body"] == "first"
+    assert orjson.loads(second)["messages"][0]["body"] == "second"